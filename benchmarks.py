@@ -0,0 +1,162 @@
+import sys
+import json
+import random
+import timeit
+import argparse
+import board_logic
+import search_engine
+import mcts_engine
+import game_core
+
+CORPUS_SEED = 2023  # Fixes the benchmark positions, so runs on different days time the same boards
+POSITION_FILLS: dict[str, float] = {"empty": 0.0, "mid-game": 0.5, "near-full": 0.9}  # Share of the cells claimed
+REGRESSION_THRESHOLD = 0.25  # How much slower than the baseline a timing may get before it is flagged
+
+
+def build_position(geometry: board_logic.BoardGeometry, fill: float, rng: random.Random) \
+        -> tuple[board_logic.BoardState, tuple[int, int] | None]:
+    # Claims cells for alternating sides in a seeded random order. Each claim takes the first open cell that neither
+    # ends the game nor leaves a line one move from completion, so the side to move has no win to take and no block to
+    # make, and the search benchmarks time a real search rather than their shortcuts for those moves. Once no such
+    # quiet cell is left, the first cell that doesn't end the game is taken instead, so the board still reaches its
+    # fill. Returns the board and the last move made on it
+    board_state = board_logic.BoardState(geometry)
+    open_cells = [(row, col) for row in range(geometry.rows) for col in range(geometry.cols)]
+    rng.shuffle(open_cells)
+    target_claims = int(len(open_cells) * fill)
+    side = board_logic.PLAYER
+    last_move = None
+    for _ in range(target_claims):
+        fallback = None
+        for cid in open_cells:
+            trial_state = board_state.copy()
+            trial_state.claim(cid, side)
+            if trial_state.winning_cells(cid, side) or trial_state.is_full():
+                continue
+            if fallback is None:
+                fallback = cid, trial_state
+            next_tiers = trial_state.move_tiers(board_logic.other_side(side))
+            if not next_tiers[board_logic.WINNING] and not next_tiers[board_logic.DEFENSIVE]:
+                break
+        else:
+            if fallback is None:
+                raise ValueError(f"Every open cell ends the game after {stone_count(board_state)} of "
+                                 f"{target_claims} claims, so the position can't reach its fill")
+            cid, trial_state = fallback
+        open_cells.remove(cid)
+        board_state = trial_state
+        last_move = cid
+        side = board_logic.other_side(side)
+    return board_state, last_move
+
+
+def build_corpus() -> dict[str, dict[str, tuple[board_logic.BoardState, tuple[int, int] | None]]]:
+    rng = random.Random(CORPUS_SEED)
+    return {mode.title: {position_name: build_position(mode.geometry, fill, rng)
+                         for position_name, fill in POSITION_FILLS.items()}
+            for mode in game_core.game_mode_list}
+
+
+def stone_count(board_state: board_logic.BoardState) -> int:
+    return int(board_state.bits[board_logic.PLAYER] | board_state.bits[board_logic.ENEMY]).bit_count()
+
+
+def time_call(function, repeats: int) -> float:
+    # Best of five runs, in microseconds per call
+    return min(timeit.repeat(function, number=repeats, repeat=5)) / repeats * 1_000_000
+
+
+def side_to_move(board_state: board_logic.BoardState) -> int:
+    # The player moves first in every position of the corpus, so whoever has fewer stones is next
+    player_stones = int(board_state.bits[board_logic.PLAYER]).bit_count()
+    enemy_stones = int(board_state.bits[board_logic.ENEMY]).bit_count()
+    return board_logic.PLAYER if player_stones == enemy_stones else board_logic.ENEMY
+
+
+def benchmark_position(board_state: board_logic.BoardState, last_move: tuple[int, int] | None, repeats: int) \
+        -> dict[str, float]:
+    geometry = board_state.geometry
+    side = side_to_move(board_state)
+    last_side = int(board_state.cells[last_move]) if last_move else side  # Whoever made the last move
+    heuristic_rng = random.Random(0)
+    timings = {
+        "heuristic move": time_call(lambda: board_logic.heuristic_move(board_state, side, 0, heuristic_rng), repeats),
+        "negamax d2 move": time_call(lambda: search_engine.SearchEngine(geometry).best_move(board_state, side, 2),
+                                     max(repeats // 100, 1)),
+        "mcts 640 move": time_call(lambda: mcts_engine.MctsEngine(geometry, 0).best_move(board_state, side,
+                                                                                         playouts=640),
+                                   max(repeats // 100, 1)),
+        "full win scan": time_call(lambda: board_state.has_won(side), repeats),
+        "tie check": time_call(board_state.is_full, repeats),
+    }
+    if last_move:
+        timings["last-move win"] = time_call(lambda: board_state.winning_cells(last_move, last_side), repeats)
+    return timings
+
+
+def print_table(results: dict, stone_counts: dict, regressions: set):
+    columns = ["heuristic move", "negamax d2 move", "mcts 640 move", "last-move win", "full win scan", "tie check"]
+    print(f"{'mode':<18} {'position':<10} {'stones':>7} " + " ".join(f"{column:>16}" for column in columns) +
+          "   (microseconds)")
+    for mode_title, positions in results.items():
+        for position_name, timings in positions.items():
+            stones, board_cells = stone_counts[mode_title][position_name]
+            cells = [f"{f'{stones}/{board_cells}':>7}"]
+            for column in columns:
+                if column not in timings:
+                    cells.append(f"{'-':>16}")
+                    continue
+                flag = "!" if (mode_title, position_name, column) in regressions else " "
+                cells.append(f"{timings[column]:>15.2f}{flag}")
+            print(f"{mode_title:<18} {position_name:<10} " + " ".join(cells))
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> set:
+    regressions = set()
+    for mode_title, positions in results.items():
+        for position_name, timings in positions.items():
+            for column, microseconds in timings.items():
+                baseline_microseconds = baseline.get(mode_title, {}).get(position_name, {}).get(column)
+                if baseline_microseconds and microseconds > baseline_microseconds * (1 + threshold):
+                    regressions.add((mode_title, position_name, column))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times CPU move selection, win detection and tie detection on a "
+                                                 "fixed set of positions for every game mode")
+    parser.add_argument("--repeats", type=int, default=1000, help="calls per timing run of the fast benchmarks")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results to a JSON baseline file")
+    parser.add_argument("--compare", metavar="PATH", help="flag timings that got slower than this baseline file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="allowed slowdown against the baseline, as a fraction")
+    args = parser.parse_args()
+
+    results: dict = {}
+    stone_counts: dict = {}  # The stones on each board, and its cells
+    for mode_title, positions in build_corpus().items():
+        results[mode_title] = {position_name: benchmark_position(board_state, last_move, args.repeats)
+                               for position_name, (board_state, last_move) in positions.items()}
+        stone_counts[mode_title] = {position_name: (stone_count(board_state), len(board_state.geometry.cell_windows))
+                                    for position_name, (board_state, _) in positions.items()}
+
+    regressions: set = set()
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file), args.threshold)
+
+    print_table(results, stone_counts, regressions)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        print(f"{len(regressions)} timing(s) more than {args.threshold:.0%} slower than {args.compare} (marked !)")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
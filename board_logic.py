@@ -0,0 +1,221 @@
+from functools import lru_cache
+import numpy as np
+
+# Values used to tell the two sides of a game apart inside the board logic
+EMPTY = 0
+PLAYER = 1
+ENEMY = 2
+
+# The tiers of moves the CPU picks from, strongest first. Random moves are the fallback when all four are empty
+WINNING = 0  # A move that completes a line
+DEFENSIVE = 1  # A move that stops the opponent from completing a line
+OPTIMAL = 2  # A move that builds on a chain of 2 or longer
+CONSTRUCTIVE = 3  # A move that starts a chain, or claims a square inside the opponent's chain
+MOVE_TIERS = (WINNING, DEFENSIVE, OPTIMAL, CONSTRUCTIVE)
+TIER_LABELS = ("Winning", "Defensive", "Optimal", "Constructive")
+
+
+def other_side(side: int) -> int:
+    return PLAYER if side == ENEMY else ENEMY
+
+
+class BoardGeometry:
+
+    # The board is stored as one integer per side, one bit per cell. Cells are laid out column by column, with one
+    # spare bit on top of every column that always stays empty, so that shifted lines can never wrap into the next
+    # column. Moving one row down is a shift of 1, moving one column right is a shift of (rows + 1).
+
+    def __init__(self, rows: int, cols: int, objective: int):
+        self.rows = rows
+        self.cols = cols
+        self.objective = objective
+        self.column_height = rows + 1
+
+        # Vertical, horizontal, descending diagonal and ascending diagonal shifts
+        self.shifts = (1, self.column_height, self.column_height + 1, self.column_height - 1)
+
+        self.full_mask = 0
+        for row in range(rows):
+            for col in range(cols):
+                self.full_mask |= self.cell_bit((row, col))
+
+        # Every line of (objective) cells that could win the game, built once per board shape. Rows come first, then
+        # columns, descending diagonals and ascending diagonals
+        self.windows: list[tuple[tuple[int, int], ...]] = []
+        for row_step, col_step in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+            for row in range(rows):
+                for col in range(cols):
+                    end_row = row + row_step * (objective - 1)
+                    end_col = col + col_step * (objective - 1)
+                    if 0 <= end_row < rows and end_col < cols:
+                        self.windows.append(tuple((row + row_step * i, col + col_step * i) for i in range(objective)))
+
+        self.window_masks: list[int] = []
+        for window in self.windows:
+            mask = 0
+            for cid in window:
+                mask |= self.cell_bit(cid)
+            self.window_masks.append(mask)
+
+        # The indexes of every window that passes through a given cell
+        self.cell_windows: dict[tuple[int, int], list[int]] = {(row, col): []
+                                                               for row in range(rows) for col in range(cols)}
+        for index, window in enumerate(self.windows):
+            for cid in window:
+                self.cell_windows[cid].append(index)
+
+        # The same index as NumPy arrays, with cells given as flat (row * cols + col) positions
+        self.window_cells = np.array([[row * cols + col for row, col in window] for window in self.windows],
+                                     dtype=np.intp).reshape(len(self.windows), objective)
+        self.cell_window_arrays = {cid: np.array(indexes, dtype=np.intp) for cid, indexes in self.cell_windows.items()}
+
+        # The move tier a window offers to a side, looked up by (the side's stones in it, the opponent's stones in it).
+        # -1 stands for empty windows and windows both sides are in
+        self.tier_table = np.full((objective + 1, objective + 1), -1, dtype=np.int8)
+        self.tier_table[1:, 0] = CONSTRUCTIVE
+        self.tier_table[0, 2:] = CONSTRUCTIVE
+        self.tier_table[2:, 0] = OPTIMAL
+        self.tier_table[0, objective - 1] = DEFENSIVE
+        self.tier_table[objective - 1, 0] = WINNING
+
+    def __reduce__(self):
+        # Geometries are shared through get_geometry, so a pickled one is rebuilt from (or found in) that cache
+        return get_geometry, (self.rows, self.cols, self.objective)
+
+    def cell_bit(self, cid: tuple[int, int]) -> int:
+        return 1 << (cid[1] * self.column_height + cid[0])
+
+    def has_connection(self, bits: int) -> bool:
+        for shift in self.shifts:
+            # Each pass doubles the run length that a remaining bit stands for, so a line of 6 only takes 3 ANDs
+            run_bits = bits
+            run_length = 1
+            while run_length * 2 <= self.objective:
+                run_bits &= run_bits >> (shift * run_length)
+                run_length *= 2
+            if run_length < self.objective:
+                run_bits &= run_bits >> (shift * (self.objective - run_length))
+            if run_bits:
+                return True
+        return False
+
+    def completes_line(self, bits: int, cid: tuple[int, int]) -> bool:
+        # Whether the bits hold a whole line through the given cell. The search engines ask this of every move they
+        # try, so it stops at the first line it finds
+        for index in self.cell_windows[cid]:
+            if bits & self.window_masks[index] == self.window_masks[index]:
+                return True
+        return False
+
+    def winning_line(self, bits: int, cid: tuple[int, int]) -> list[tuple[int, int]]:
+        # Only the windows passing through the given cell are tested, so this is meant to run once per move
+        victory_cells: list[tuple[int, int]] = []
+        for index in self.cell_windows[cid]:
+            if bits & self.window_masks[index] == self.window_masks[index]:
+                victory_cells.extend(self.windows[index])
+        return list(dict.fromkeys(victory_cells))  # Overlapping windows share cells
+
+
+@lru_cache(maxsize=None)
+def get_geometry(rows: int, cols: int, objective: int) -> BoardGeometry:
+    return BoardGeometry(rows, cols, objective)
+
+
+class ThreatMap:
+
+    # Keeps each side's stone count for every window as a NumPy array, and for each side the windows that offer each
+    # move tier. Claiming a cell only reclassifies the windows through it, so reading the tiers costs as much as the
+    # windows in them and doesn't grow with the board
+
+    def __init__(self, geometry: BoardGeometry):
+        self.geometry = geometry
+        self.counts = {PLAYER: np.zeros(len(geometry.windows), dtype=np.int8),
+                       ENEMY: np.zeros(len(geometry.windows), dtype=np.int8)}
+        self.tiers = {PLAYER: np.full(len(geometry.windows), -1, dtype=np.int8),
+                      ENEMY: np.full(len(geometry.windows), -1, dtype=np.int8)}
+        self.tier_windows: dict[int, list[set[int]]] = {PLAYER: [set() for _ in MOVE_TIERS],
+                                                        ENEMY: [set() for _ in MOVE_TIERS]}
+
+    def claim(self, cid: tuple[int, int], side: int):
+        indexes = self.geometry.cell_window_arrays[cid]
+        self.counts[side][indexes] += 1
+        self.update_tiers(indexes)
+
+    def window_tiers(self, side: int, indexes: np.ndarray) -> np.ndarray:
+        # The tier each of the windows offers to the given side
+        return self.geometry.tier_table[self.counts[side][indexes], self.counts[other_side(side)][indexes]]
+
+    def update_tiers(self, indexes: np.ndarray):
+        for side in (PLAYER, ENEMY):
+            new_tiers = self.window_tiers(side, indexes)
+            old_tiers = self.tiers[side][indexes]
+            changed = new_tiers != old_tiers
+            for index, old_tier, new_tier in zip(indexes[changed].tolist(), old_tiers[changed].tolist(),
+                                                 new_tiers[changed].tolist()):
+                if old_tier >= 0:
+                    self.tier_windows[side][old_tier].discard(index)
+                if new_tier >= 0:
+                    self.tier_windows[side][new_tier].add(index)
+            self.tiers[side][indexes] = new_tiers
+
+    def copy(self) -> "ThreatMap":
+        threats = ThreatMap(self.geometry)
+        threats.counts = {side: counts.copy() for side, counts in self.counts.items()}
+        threats.tiers = {side: tiers.copy() for side, tiers in self.tiers.items()}
+        threats.tier_windows = {side: [set(windows) for windows in tier_windows]
+                                for side, tier_windows in self.tier_windows.items()}
+        return threats
+
+
+class BoardState:
+
+    def __init__(self, geometry: BoardGeometry):
+        self.geometry = geometry
+        self.bits = {PLAYER: 0, ENEMY: 0}
+        self.cells = np.zeros((geometry.rows, geometry.cols), dtype=np.int8)  # EMPTY, PLAYER or ENEMY per cell
+        self.threats = ThreatMap(geometry)
+
+    def copy(self) -> "BoardState":
+        # The cells are one buffer copy, but the threat map's arrays and tier sets are copied along with them
+        board_state = BoardState(self.geometry)
+        board_state.bits = dict(self.bits)
+        board_state.cells = self.cells.copy()
+        board_state.threats = self.threats.copy()
+        return board_state
+
+    def claim(self, cid: tuple[int, int], side: int):
+        self.bits[side] |= self.geometry.cell_bit(cid)
+        self.cells[cid] = side
+        self.threats.claim(cid, side)
+
+    def move_tiers(self, side: int) -> list[list[tuple[int, int]]]:
+        # Open cells of every window, grouped by tier. A cell shared by several windows is listed once per window,
+        # which makes it more likely to be picked. Only the windows in the tiers are looked at
+        flat_cells = self.cells.ravel()
+        tier_lists = []
+        for tier_windows in self.threats.tier_windows[side]:
+            tier_window_cells = self.geometry.window_cells[sorted(tier_windows)]
+            open_cells = tier_window_cells[flat_cells[tier_window_cells] == EMPTY]
+            tier_lists.append([divmod(int(position), self.geometry.cols) for position in open_cells])
+        return tier_lists
+
+    def winning_cells(self, cid: tuple[int, int], side: int) -> list[tuple[int, int]]:
+        return self.geometry.winning_line(self.bits[side], cid)
+
+    def has_won(self, side: int) -> bool:
+        return self.geometry.has_connection(self.bits[side])
+
+    def is_full(self) -> bool:
+        return self.bits[PLAYER] | self.bits[ENEMY] == self.geometry.full_mask
+
+
+def heuristic_move(board_state: BoardState, side: int, difficulty: int, rng) -> tuple[tuple[int, int], str]:
+    # Picks a cell from the strongest tier that has one, and falls back to a random open cell. Every candidate has a
+    # (difficulty)% chance of being overlooked, which is what makes the easier levels easier
+    for tier, tier_cells in zip(MOVE_TIERS, board_state.move_tiers(side)):
+        candidates = [cid for cid in tier_cells if rng.randint(1, 100) > difficulty]
+        if candidates:
+            return rng.choice(candidates), TIER_LABELS[tier]
+
+    open_cells = [(int(row), int(col)) for row, col in zip(*np.nonzero(board_state.cells == EMPTY))]
+    return rng.choice(open_cells), "Random"
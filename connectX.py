@@ -1,16 +1,23 @@
 import sys
+import time
 import pygame
 from pygame import mixer
 import random
 import math
-from dataclasses import dataclass
-import numpy as np
+from collections import OrderedDict
+from collections.abc import Generator
+from functools import lru_cache
 import shelve
 import music_settings as music
+import board_logic
+import cpu_player
+from game_core import GameHandler, ReplayManager, Stat, game_mode_list, move_outcome, tic_tac_toe
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Initializing pygame, saves, music settings, etc.
 
+startup_start = time.perf_counter()  # For the startup timings printed once the first frame is up
+
 pygame.init()
 clock = pygame.time.Clock()
 
@@ -19,6 +26,8 @@ save_file = shelve.open("save_file1")
 mixer.init()
 music_object = music.MusicSettings()
 music_object.randomize_song()
+sound_bank = music.SoundBank()
+sound_bank.preload()
 
 
 class GameScreen:
@@ -28,17 +37,20 @@ class GameScreen:
 
     def resize_screen(self):
         if self.width == 1080:
-            self.width = 1600
-            self.height = 900
-            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.set_resolution(1600, 900)
         elif self.width == 1600:
-            self.width = 1920
-            self.height = 1080
-            self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+            self.set_resolution(1920, 1080, pygame.RESIZABLE)
         else:
-            self.width = 1080
-            self.height = 720
-            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.set_resolution(1080, 720)
+
+    def set_resolution(self, width: int, height: int, flags: int = 0):
+        # Also called with the new window size when a RESIZABLE window is resized
+        global layout
+        self.width = width
+        self.height = height
+        self.screen = pygame.display.set_mode((self.width, self.height), flags)
+        layout = get_layout(self.width, self.height)
+        renderer.full_redraw = True  # set_mode can hand back the same surface object, now at another size
 
 
 game_screen = GameScreen()
@@ -46,14 +58,109 @@ pygame.display.set_caption("Benndot's Connect X")
 connect_icon = pygame.image.load("images/connect.png")
 pygame.display.set_icon(connect_icon)
 
-# Setting different sized font options to be used later for general text and button labels
-xxl_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 1.4))
-xl_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 1.2))
-large_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695))
-intermediate_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 0.8))
-medium_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 0.6))
-sml_med_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 0.45))
-small_font = pygame.font.SysFont("comicsansms", math.ceil(game_screen.height * 0.0695 * 0.33))
+
+class FontRegistry:
+
+    # Every piece of text is drawn in one typeface at a handful of sizes. Looking the typeface up by name can mean a
+    # scan of the system fonts, so its file is found once, and a Font of a given size is only opened the first time
+    # something is drawn at that size. The time spent on both is kept for the startup report
+
+    def __init__(self, name: str):
+        self.name = name
+        self.path: str | None = None  # None is pygame's default font, used when the typeface isn't installed
+        self.path_resolved = False
+        self.fonts_by_size: dict[int, pygame.font.Font] = {}
+        self.lookup_seconds = 0.0
+        self.load_seconds = 0.0
+
+    def get(self, size: int) -> pygame.font.Font:
+        if size not in self.fonts_by_size:
+            start = time.perf_counter()
+            if not self.path_resolved:
+                self.path = pygame.font.match_font(self.name)
+                self.path_resolved = True
+                self.lookup_seconds = time.perf_counter() - start
+                start = time.perf_counter()
+            self.fonts_by_size[size] = pygame.font.Font(self.path, size)
+            self.load_seconds += time.perf_counter() - start
+        return self.fonts_by_size[size]
+
+    def report(self) -> str:
+        return f"font lookup ({self.name}): {self.lookup_seconds * 1000:.1f} ms, {len(self.fonts_by_size)} size(s) " \
+               f"loaded in {self.load_seconds * 1000:.1f} ms"
+
+
+font_registry = FontRegistry("comicsansms")
+
+
+class Layout:
+
+    # Everything whose size follows the resolution: the fonts used for text and button labels, the width of cell
+    # outlines and the rectangles of every game mode's cells. One Layout is built per resolution and kept (see
+    # get_layout), so switching back to a resolution costs nothing
+
+    # Font sizes as multiples of the large font, which is 6.95% of the screen height
+    font_scales = {"xxl": 1.4, "xl": 1.2, "large": 1, "intermediate": 0.8, "medium": 0.6, "sml_med": 0.45,
+                   "small": 0.33}
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        self.font_sizes = {name: math.ceil(height * 0.0695 * scale) for name, scale in self.font_scales.items()}
+
+        self.outline_width = int(height / 360)
+        self.cell_rects_by_mode: dict[str, dict[tuple[int, int], pygame.Rect]] = {}
+
+    def font(self, name: str) -> pygame.font.Font:
+        # Game modes refer to the font their symbols are drawn in by name
+        return font_registry.get(self.font_sizes[name])
+
+    @property
+    def xxl_font(self) -> pygame.font.Font:
+        return self.font("xxl")
+
+    @property
+    def xl_font(self) -> pygame.font.Font:
+        return self.font("xl")
+
+    @property
+    def large_font(self) -> pygame.font.Font:
+        return self.font("large")
+
+    @property
+    def intermediate_font(self) -> pygame.font.Font:
+        return self.font("intermediate")
+
+    @property
+    def medium_font(self) -> pygame.font.Font:
+        return self.font("medium")
+
+    @property
+    def sml_med_font(self) -> pygame.font.Font:
+        return self.font("sml_med")
+
+    @property
+    def small_font(self) -> pygame.font.Font:
+        return self.font("small")
+
+    def cell_rects(self, game_mode) -> dict[tuple[int, int], pygame.Rect]:
+        # Where each of a game mode's cells sits on screen, worked out from the mode's offsets and steps
+        if game_mode.title not in self.cell_rects_by_mode:
+            self.cell_rects_by_mode[game_mode.title] = {
+                (row, col): pygame.Rect(self.width * (game_mode.cell_x_offset + col * game_mode.x_offset_step),
+                                        self.height * (game_mode.cell_y_offset + row * game_mode.y_offset_step),
+                                        self.width * game_mode.cell_width, self.height * game_mode.cell_height)
+                for row in range(game_mode.board.shape[0]) for col in range(game_mode.board.shape[1])}
+        return self.cell_rects_by_mode[game_mode.title]
+
+
+@lru_cache(maxsize=8)
+def get_layout(width: int, height: int) -> Layout:
+    return Layout(width, height)
+
+
+layout = get_layout(game_screen.width, game_screen.height)
 
 # Establishing a number of reusable rgb values for several colors
 slategray = (112, 128, 144)
@@ -69,15 +176,271 @@ thistle_green = (210, 210, 190)
 black = (0, 0, 0)
 
 
-def create_onscreen_text(font_size, color, message, x, y, x_adjust: bool = False):
+class FrameEvents:
+
+    # The event queue is drained once at the top of every frame, and the same list is handed to every widget and to
+    # the screen's own event loop. A widget that acts on a click consumes it, so the click can't also trigger a
+    # button on the screen that the widget opens
+
+    def __init__(self):
+        self.events: list[pygame.event.Event] = []
+        self.received = 0  # Events drained this frame, counting the ones consumed since
+
+    def pump(self) -> list[pygame.event.Event]:
+        self.events = pygame.event.get()
+        self.received = len(self.events)
+        return self.events
+
+    def wait(self, timeout: int) -> list[pygame.event.Event]:
+        # Like pump, but sleeps until an event arrives or the timeout (in milliseconds) runs out
+        first_event = pygame.event.wait(timeout)
+        self.events = [first_event] if first_event.type != pygame.NOEVENT else []
+        self.events += pygame.event.get()
+        self.received = len(self.events)
+        return self.events
+
+    def consume(self, event: pygame.event.Event):
+        self.events.remove(event)
+
+
+frame_events = FrameEvents()
+
+
+class TimerScheduler:
+
+    # Delayed actions on top of pygame.time.set_timer. Every named timer has its own custom event type and goes off
+    # once, and main() runs its action when the event comes through. Scheduling a name again replaces its pending
+    # action. Each timer event carries the number it was scheduled under, so an event left over from a cancelled or
+    # replaced timer does nothing
+
+    def __init__(self):
+        self.event_types: dict[str, int] = {}
+        self.actions: dict[int, tuple[int, callable]] = {}  # Event type -> (timer number, action)
+        self.timer_count = 0
+
+    def schedule(self, name: str, delay: int, action):  # Delay in milliseconds
+        if name not in self.event_types:
+            self.event_types[name] = pygame.event.custom_type()
+        event_type = self.event_types[name]
+        self.timer_count += 1
+        self.actions[event_type] = (self.timer_count, action)
+        pygame.time.set_timer(pygame.event.Event(event_type, timer=self.timer_count), max(int(delay), 1), loops=1)
+
+    def cancel(self, name: str):
+        if name in self.event_types:
+            pygame.time.set_timer(self.event_types[name], 0)
+            self.actions.pop(self.event_types[name], None)
+
+    def dispatch(self, events: list[pygame.event.Event]):
+        for evnt in events:
+            timer_number, action = self.actions.get(evnt.type, (None, None))
+            if action and evnt.timer == timer_number:
+                del self.actions[evnt.type]
+                action()
+
+
+timers = TimerScheduler()
+
+
+class IdleRate:
+
+    # Yielded instead of a frame rate by screens that have nothing to animate and only change on input. The frame loop
+    # sleeps while such a screen is quiet, and runs at the given frame rate while it responds to input
+
+    __slots__ = ("frame_rate",)
+
+    def __init__(self, frame_rate: int):
+        self.frame_rate = frame_rate
+
+
+IDLE = IdleRate(15)  # For menus, where a few frames of delay on a click go unnoticed
+GAME_IDLE = IdleRate(60)  # For the game grid, whose hover outlines and clicks need to keep up with the mouse
+IDLE_TIMEOUT = 1000  # The longest an idle screen sleeps without any input, in milliseconds
+
+
+class SceneManager:
+
+    # Screens are generators that draw one frame each time they're advanced and then yield their frame rate, or an
+    # IdleRate. They sit on a stack, and main() only ever advances the one on top. Screens move between each other by
+    # asking for a push, a pop or a replacement, which is carried out once the current frame is over, so navigating
+    # never nests one screen's loop inside another's and a session of any length runs at the same stack depth
+
+    def __init__(self):
+        self.stack: list[Generator[int | IdleRate, None, None]] = []
+        self.transitions: list[tuple[str, Generator[int | IdleRate, None, None] | None]] = []
+
+    def current(self) -> Generator[int | IdleRate, None, None]:
+        return self.stack[-1]
+
+    def push(self, scene: Generator[int | IdleRate, None, None]):  # Opens a screen over the current one
+        self.transitions.append(("push", scene))
+
+    def pop(self):  # Goes back to the screen underneath
+        self.transitions.append(("pop", None))
+
+    def replace(self, scene: Generator[int | IdleRate, None, None]):  # Moves on without keeping the current screen
+        self.transitions.append(("replace", scene))
+
+    def reset(self, scene: Generator[int | IdleRate, None, None]):
+        # Closes every open screen and starts again from this one
+        self.transitions.append(("reset", scene))
+
+    def apply_transitions(self):
+        for kind, scene in self.transitions:
+            if kind in ("pop", "replace") and self.stack:
+                self.stack.pop().close()
+            elif kind == "reset":
+                while self.stack:
+                    self.stack.pop().close()
+            if scene is not None:
+                self.stack.append(scene)
+        self.transitions = []
+
+
+scenes = SceneManager()
+
+
+class TextCache:
+
+    # Rendered labels, keyed by (font, message, colour). Almost all of the game's text is the same from one frame to
+    # the next, so most frames only blit surfaces rendered earlier. The least recently used label is dropped once
+    # the cache is full. Every resolution has its own fonts (see Layout), so labels rendered for another resolution
+    # are simply no longer asked for and age out
+
+    max_size = 512
+
+    def __init__(self):
+        self.surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def render(self, font: pygame.font.Font, message: str, color: tuple) -> pygame.Surface:
+        key = (font, message, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(message, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+text_cache = TextCache()
+
+
+class FrameRenderer:
+
+    # Dirty-rectangle drawing. Screens describe each frame as a list of draw commands, each keyed by everything that
+    # affects what it puts on screen. Commands that were also drawn last frame are already on the display and are
+    # skipped. Only the areas of commands that appeared or disappeared are repainted (background first, then every
+    # command overlapping the area, clipped to it and in the order they were issued) and pushed to the display
+
+    def __init__(self):
+        self.commands: list[tuple[tuple, pygame.Rect, callable]] = []
+        self.drawn: dict[tuple, pygame.Rect] = {}
+        self.background = None
+        self.surface = None
+        self.full_redraw = True
+        self.changed = False  # Whether the last frame put anything new on the display
+
+    def begin_frame(self, background: tuple | pygame.Surface):
+        # Replaces filling the screen with the background, which is either a colour or a pre-rendered layer
+        if background != self.background or game_screen.screen is not self.surface:
+            self.full_redraw = True  # A new background or a new display surface means everything gets drawn again
+            self.background = background
+            self.surface = game_screen.screen
+        self.commands = []
+
+    def draw(self, key: tuple, rect: pygame.Rect, draw_function):
+        self.commands.append((key, rect, draw_function))
+
+    def blit(self, surface: pygame.Surface, position: tuple[float, float]):
+        rect = surface.get_rect(topleft=position)
+        self.draw(("blit", surface, rect.topleft), rect, lambda: game_screen.screen.blit(surface, rect))
+
+    def rect(self, color: tuple, rect, width: int = 0):
+        rect = pygame.Rect(rect)
+        self.draw(("rect", color, tuple(rect), width), rect,
+                  lambda: pygame.draw.rect(game_screen.screen, color, rect, width))
+
+    def paint_background(self, area: pygame.Rect | None = None):
+        if isinstance(self.background, pygame.Surface):
+            game_screen.screen.blit(self.background, area or (0, 0), area)
+        else:
+            game_screen.screen.fill(self.background, area)
+
+    def end_frame(self):
+        # Replaces pygame.display.update()
+        current = {key: rect for key, rect, _ in self.commands}
+        if self.full_redraw:
+            self.paint_background()
+            for _, _, draw_function in self.commands:
+                draw_function()
+            self.drawn = current
+            self.full_redraw = False
+            self.changed = True
+            pygame.display.update()
+            return
+
+        dirty_rects = [rect for key, rect in current.items() if key not in self.drawn]
+        dirty_rects += [rect for key, rect in self.drawn.items() if key not in current]
+
+        for dirty_rect in dirty_rects:
+            game_screen.screen.set_clip(dirty_rect)
+            self.paint_background(dirty_rect)
+            for _, rect, draw_function in self.commands:
+                if rect.colliderect(dirty_rect):
+                    draw_function()
+        game_screen.screen.set_clip(None)
+
+        self.drawn = current
+        self.changed = bool(dirty_rects)
+        pygame.display.update(dirty_rects)
+
+
+renderer = FrameRenderer()
 
-    text = font_size.render(message, True, color)
+
+class BackgroundLayers:
+
+    # The parts of a screen that never change while it is shown (its fill, titles, fixed labels and images) are
+    # drawn once onto a full-screen surface, which the renderer then uses as that screen's background. Layers are
+    # kept per resolution, so switching back to a resolution reuses them. Full-screen surfaces are large, so only
+    # the most recently used ones are kept, which matters while a RESIZABLE window is being dragged through sizes
+
+    max_size = 16
+
+    def __init__(self):
+        self.layers: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def get(self, name: str, build_function) -> pygame.Surface:
+        key = (name, game_screen.width, game_screen.height)
+        if key not in self.layers:
+            layer = pygame.Surface((game_screen.width, game_screen.height)).convert()
+            build_function(layer)
+            self.layers[key] = layer
+            if len(self.layers) > self.max_size:
+                self.layers.popitem(last=False)
+        else:
+            self.layers.move_to_end(key)
+        return self.layers[key]
+
+
+background_layers = BackgroundLayers()
+
+
+def create_onscreen_text(font_size, color, message, x, y, x_adjust: bool = False, surface: pygame.Surface = None):
+
+    text = text_cache.render(font_size, message, color)
 
     if x_adjust:
         text_width = text.get_width()
         x = x - (text_width / 2)
 
-    game_screen.screen.blit(text, (x, y))
+    if surface:  # Drawing onto a background layer rather than the screen
+        surface.blit(text, (x, y))
+    else:
+        renderer.blit(text, (x, y))
 
 
 def display_text_over_multiple_lines(text, font, line_character_limit, start_x, start_y, line_height_step):
@@ -102,12 +465,16 @@ def create_transparent_button(width, height, x, y):
     mouse = pygame.mouse.get_pos()
 
     if x + width > mouse[0] > x and y + height > mouse[1] > y:
-        s = pygame.Surface((width, height))  # the size of your rect
-        s.set_alpha(128)  # alpha level
-        s.fill((255, 255, 255))  # this fills the entire surface
-        game_screen.screen.blit(s, (x, y))  # (0,0) are the top-left coordinates
-        for evnt in pygame.event.get():
+        def highlight():
+            s = pygame.Surface((width, height))  # the size of your rect
+            s.set_alpha(128)  # alpha level
+            s.fill((255, 255, 255))  # this fills the entire surface
+            game_screen.screen.blit(s, (x, y))  # (0,0) are the top-left coordinates
+
+        renderer.draw(("highlight", width, height, x, y), pygame.Rect(x, y, width, height), highlight)
+        for evnt in frame_events.events:
             if evnt.type == pygame.MOUSEBUTTONUP:
+                frame_events.consume(evnt)
                 return True
 
 
@@ -116,7 +483,7 @@ def create_text_button(font_choice, text_color, msg, x, y, hover_color, default_
 
     mouse = pygame.mouse.get_pos()
 
-    button_msg = font_choice.render(msg, True, text_color)
+    button_msg = text_cache.render(font_choice, msg, text_color)
 
     button_width = button_msg.get_width() + (button_msg.get_width() * 0.20)
     button_height = button_msg.get_height() + (button_msg.get_height() * 0.20)
@@ -126,95 +493,17 @@ def create_text_button(font_choice, text_color, msg, x, y, hover_color, default_
 
     # The experimental version
     if x + button_width > mouse[0] > x and y + button_height > mouse[1] > y:
-        pygame.draw.rect(game_screen.screen, hover_color, (x, y, button_width, button_height))
-        for evnt in pygame.event.get():
+        renderer.rect(hover_color, (x, y, button_width, button_height))
+        for evnt in frame_events.events:
             if evnt.type == pygame.MOUSEBUTTONUP:
+                frame_events.consume(evnt)
                 if click_sound:
-                    button_effect = mixer.Sound('audio/click_v2.mp3')
-                    mixer.Sound.play(button_effect)
+                    sound_bank.play("click")
                 return True
     else:
-        pygame.draw.rect(game_screen.screen, default_color, (x, y, button_width, button_height))
+        renderer.rect(default_color, (x, y, button_width, button_height))
 
-    game_screen.screen.blit(button_msg, (x + button_width / 10, y + button_height / 10))
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-# 3. Defining the GameMode class and creating several instances representing a variety of playable game modes
-
-
-@dataclass()
-class GameMode:
-    title: str  # The name of the game mode
-    board: np.ndarray  # The arrangement/dimensions of the game board_shape
-    objective: int  # The number of consecutive characters needed to win
-    cell_width: float = float(game_screen.width / 10)
-    cell_height: float = float(game_screen.height / 7)
-    cell_x_offset: float = float(0.15)  # A multiplier for determining a cell's generated position
-    cell_y_offset: float = float(0.12)  # A multiplier for determining a cell's generated position
-    x_offset_step: float = float(0.1)  # The space multiplier that separates each cell as they're generated
-    y_offset_step: float = float(0.15)
-    font: pygame.font = large_font
-
-
-connect4 = GameMode("Connect4", np.full((6, 7), "-"), 4, cell_width=float(game_screen.width / 11),
-                    cell_height=float(game_screen.height / 8), x_offset_step=float(0.095),
-                    y_offset_step=float(0.125), cell_x_offset=float(0.17))
-
-connect3 = GameMode("Connect3", np.full((4, 5), "-"), 3, cell_width=float(game_screen.width / 8.5),
-                    cell_height=float(game_screen.height / 6.5), x_offset_step=float(0.12),
-                    y_offset_step=float(0.16), cell_x_offset=float(0.2))
-
-wide_boi = GameMode("Wide Boi", np.full((4, 8), "-"), 4, cell_x_offset=0.1, cell_y_offset=0.17, y_offset_step=0.15)
-
-tall_boi = GameMode("Tall Boi", np.full((8, 4), "-"), 4, cell_x_offset=0.33, cell_width=float(game_screen.width / 13),
-                    cell_height=float(game_screen.height / 10), x_offset_step=float(0.08), y_offset_step=float(0.1))
-
-tic_tac_toe = GameMode("Tic-Tac-Toe", np.full((3, 3), "-"), 3, cell_width=float(game_screen.width / 6.5),
-                       cell_height=float(game_screen.height / 5), x_offset_step=float(0.16),
-                       y_offset_step=float(0.22), cell_x_offset=float(0.24),
-                       font=xl_font)
-
-cheese_crackers = GameMode("Cheese & Crackers", np.full((5, 5), "-"), 4, cell_x_offset=0.24)
-
-deluxe = GameMode("Connect6", np.full((9, 10), "-"), 6, cell_x_offset=0.12, cell_width=float(game_screen.width / 15),
-                  cell_height=float(game_screen.height / 11), x_offset_step=0.07, y_offset_step=0.09)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-# 4. DEFINING THE STAT CLASS AND THE REPLAY CLASS TO TRACK IN-GAME HISTORY
-
-
-@dataclass()
-class Stat:
-    name: str  # The name of the stat in question
-    value: int  # the value of that statistic
-
-
-@dataclass()
-class Replay:
-    id: int  # Unchanging unique identifier for each replay instance
-    name: str  # Name of the replay, can be edited by the user
-    game_mode: GameMode  # In which game mode did the game take place
-    player_moves: list  # The sequence of moves that the player made
-    enemy_moves: list  # The sequence of moves that the enemy made
-    priority: bool  # Whether player had the priority in the game or not
-    player_symbol: str
-    enemy_symbol: str
-
-    def __str__(self):
-        return f"Replay: {self.name}, Mode: {self.game_mode.title}, Turns: " \
-               f"{len(self.player_moves) if len(self.player_moves) >= len(self.enemy_moves) else len(self.enemy_moves)}"
-
-
-class ReplayManager:
-    r1 = Replay(1, "Empty", tic_tac_toe, [], [], True, "X", "O")
-    r2 = Replay(2, "Empty", tic_tac_toe, [], [], True, "X", "O")
-    r3 = Replay(3, "Empty", tic_tac_toe, [], [], True, "X", "O")
-    r4 = Replay(4, "Empty", tic_tac_toe, [], [], True, "X", "O")
-    r5 = Replay(5, "Empty", tic_tac_toe, [], [], True, "X", "O")
-
-    replay_list = [r1, r2, r3, r4, r5]
+    renderer.blit(button_msg, (x + button_width / 10, y + button_height / 10))
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -240,25 +529,6 @@ class DataTracker:
     rule_toggle: bool = True
 
 
-class GameHandler:
-
-    current_mode = connect4
-
-    difficulty: int = 0  # Setting a CPU difficulty level variable
-
-    player_symbol: str = "X"
-    enemy_symbol: str = "O"
-
-    priority: bool = True  # Who goes/went first in a given game
-    player_turn = True
-
-    enemy_turn_length = 3500  # in milliseconds
-    enemy_turn_start_time = 1  # Will contain the pygame.time.getticks() of when the CPU's turn began
-    time_taken = False  # Bool to show that the enemy_turn_start_time was taken
-
-    game_status: str = "pregame"  # Options are pregame, ongoing, won, lost, tied
-
-
 # ----------------------------------------------------------------------------------------------------------------------
 # 6. Initializing all shelved save data that the game tracks between sessions
 
@@ -268,7 +538,14 @@ class GameHandler:
 # 8. Menu, game mode selection (and creation), and board_shape display functions
 
 
-def title_screen():
+def build_title_layer(layer: pygame.Surface):
+
+    layer.fill((0, 0, 200))
+
+    create_onscreen_text(layout.intermediate_font, white, "Connect X", game_screen.width / 2, game_screen.height / 90,
+                         True, layer)
+    create_onscreen_text(layout.medium_font, white, "by Benndot", game_screen.width / 2, game_screen.height / 13,
+                         True, layer)
 
     title_image = pygame.image.load("images/connect4-board-pic.jpg")
 
@@ -277,42 +554,43 @@ def title_screen():
     # Scales the start screen image to the screen size
     title_image = pygame.transform.scale(title_image, (game_screen.width, game_screen.height - (game_screen.height / 10)
                                                        ))
+    layer.blit(title_image, (0, nav_bar_height))
 
-    while True:
-        game_screen.screen.fill((0, 0, 200))
 
-        create_onscreen_text(intermediate_font, white, "Connect X", game_screen.width / 2, game_screen.height / 90,
-                             True)
-        create_onscreen_text(medium_font, white, "by Benndot", game_screen.width / 2, game_screen.height / 13,
-                             True)
+def title_screen():
+
+    while True:
+        renderer.begin_frame(background_layers.get("title_screen", build_title_layer))
 
-        start_button = create_text_button(medium_font, black, "Start", game_screen.width * .15, game_screen.height *
-                                          0.02, green, lighter_green, True)
+        start_button = create_text_button(layout.medium_font, black, "Start", game_screen.width * .15,
+                                          game_screen.height * 0.02, green, lighter_green, True)
 
         if start_button:
-            main_menu()
+            scenes.replace(main_menu())
 
-        options_button = create_text_button(medium_font, black, "Options", game_screen.width * .8,
+        options_button = create_text_button(layout.medium_font, black, "Options", game_screen.width * .8,
                                             game_screen.height * 0.02, (200, 200, 0), (120, 120, 0), True)
 
         if options_button:
-            sound_menu()
+            scenes.push(sound_menu())
 
-        music_button = create_text_button(small_font, blackish, "Toggle Music", game_screen.width * .925,
+        music_button = create_text_button(layout.small_font, blackish, "Toggle Music", game_screen.width * .925,
                                           game_screen.height * 0.035, lightgray, slategray, True)
 
         if music_button:
             music_object.music_toggle()
 
-        game_screen.screen.blit(title_image, (0, nav_bar_height))
+        yield IDLE
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
 
-        pygame.display.update()
-        clock.tick(15)
+def build_main_menu_layer(layer: pygame.Surface):
+
+    layer.fill((230, 60, 160))
+
+    create_onscreen_text(layout.large_font, black, "Main Menu", game_screen.width / 2, game_screen.height * 0.05,
+                         True, layer)
+    create_onscreen_text(layout.medium_font, black, "Difficulty Level", game_screen.width / 1.3,
+                         game_screen.height * 0.3, False, layer)
 
 
 def main_menu():
@@ -322,58 +600,48 @@ def main_menu():
     stats_replays_str = {"Replays": replays_menu}
     audio_options = {"Audio Options": sound_menu}
     save_options_str = {"Save File Options": save_settings}
-    quit_game_str = {"Quit": sys.exit}
+    quit_game_str = {"Quit": quit_game}
 
     menu_options = [play_game_str, change_symbol_str, stats_replays_str, audio_options, save_options_str, quit_game_str]
 
     while True:
+        renderer.begin_frame(background_layers.get("main_menu", build_main_menu_layer))
 
-        game_screen.screen.fill((230, 60, 160))
-
-        create_onscreen_text(large_font, black, "Main Menu", game_screen.width / 2, game_screen.height * 0.05,
-                             True)
-
-        create_onscreen_text(medium_font, black, f"Wins: {DataTracker.wins.value}", game_screen.width / 15,
+        create_onscreen_text(layout.medium_font, black, f"Wins: {DataTracker.wins.value}", game_screen.width / 15,
                              game_screen.height * 0.9)
-        create_onscreen_text(medium_font, black, f"Losses: {DataTracker.losses.value}", game_screen.width / 2.25,
+        create_onscreen_text(layout.medium_font, black, f"Losses: {DataTracker.losses.value}", game_screen.width / 2.25,
                              game_screen.height * 0.9)
-        create_onscreen_text(medium_font, black, f"Ties: {DataTracker.ties.value}", game_screen.width / 1.2,
+        create_onscreen_text(layout.medium_font, black, f"Ties: {DataTracker.ties.value}", game_screen.width / 1.2,
                              game_screen.height * 0.9)
 
         base_height = game_screen.height * 0.25
         height_multiplier = 1
         for index, option in enumerate(menu_options, 1):
-            button = create_text_button(medium_font, white, f"{index}. {list(option.keys())[0]}", game_screen.width / 4,
-                                        base_height * height_multiplier, lighter_green, green, False)
+            button = create_text_button(layout.medium_font, white, f"{index}. {list(option.keys())[0]}",
+                                        game_screen.width / 4, base_height * height_multiplier, lighter_green, green,
+                                        False)
             if button:
-                option.get(list(option.keys())[0])()
+                scenes.push(option.get(list(option.keys())[0])())
 
             height_multiplier += 0.4
 
-        create_onscreen_text(medium_font, black, "Difficulty Level", game_screen.width / 1.3,
-                             game_screen.height * 0.3, False)
-
-        difficulty_values: list[int] = [66, 33, 0]
-        difficulty_titles: list[str] = ["Easy", "Medium", "Hard"]
+        difficulty_values: list[int] = [66, 33, 0, 0, 0]
+        difficulty_titles: list[str] = ["Easy", "Medium", "Hard", "Expert", "Gambler"]
+        difficulty_engines: list[str] = ["heuristic", "heuristic", "heuristic", "negamax", "mcts"]
         base_height = game_screen.height * 0.4
         dif_height_multiplier = 1
         for index, difficulty in enumerate(difficulty_values):
-            difficulty_button = create_text_button(medium_font, black, difficulty_titles[index],
+            difficulty_button = create_text_button(layout.medium_font, black, difficulty_titles[index],
                                                    game_screen.width / 1.25, base_height * dif_height_multiplier,
                                                    lighter_green, green, False)
 
             if difficulty_button:
                 GameHandler.difficulty = difficulty_values[index]
+                GameHandler.cpu_engine = difficulty_engines[index]
 
-            dif_height_multiplier += 0.3
-
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+            dif_height_multiplier += 0.25
 
-        pygame.display.update()
-        clock.tick(15)
+        yield IDLE
 
 
 def replays_menu():
@@ -381,35 +649,32 @@ def replays_menu():
     delete_option: bool = False
 
     while True:
+        renderer.begin_frame((30, 105, 230))
 
-        game_screen.screen.fill((30, 105, 230))
-
-        create_onscreen_text(large_font, black, "Replays Menu", game_screen.width / 2, game_screen.height * 0.05, True)
+        create_onscreen_text(layout.large_font, black, "Replays Menu", game_screen.width / 2, game_screen.height * 0.05,
+                             True)
 
         height_multiplier = 1
         for replay in ReplayManager.replay_list:
-            replay_button = create_text_button(medium_font, black, replay.__str__(), game_screen.width / 2,
+            replay_button = create_text_button(layout.medium_font, black, replay.__str__(), game_screen.width / 2,
                                                game_screen.height * 0.25 * height_multiplier, lightgray, slategray,
                                                True, False)
 
             if replay_button:
                 if replay.name != "Empty":
-                    button_click = mixer.Sound("audio/button_click.mp3")
-                    mixer.Sound.play(button_click)
-                    replay_player(replay)
+                    sound_bank.play("button_click")
+                    scenes.push(replay_player(replay))
                 else:
-                    denial_sound = mixer.Sound("audio/rejection.wav")
-                    mixer.Sound.play(denial_sound)
+                    sound_bank.play("rejection")
 
             if delete_option:
-                delete_button = create_text_button(medium_font, black, "X", game_screen.width * 0.88,
+                delete_button = create_text_button(layout.medium_font, black, "X", game_screen.width * 0.88,
                                                    game_screen.height * 0.25 * height_multiplier,
                                                    red if replay.name == "Empty" else green, lightgray, True, False)
 
                 if delete_button:
                     if replay.name != "Empty":
-                        delete_sound = mixer.Sound("audio/lose.wav")
-                        mixer.Sound.play(delete_sound)
+                        sound_bank.play("lose")
                         replay.name = "Empty"
                         replay.game_mode = tic_tac_toe
                         replay.player_moves = []
@@ -419,31 +684,24 @@ def replays_menu():
                         replay.enemy_symbol = "O"
                         print("Replay deleted!")
                     else:
-                        reject_sound = mixer.Sound("audio/rejection.wav")
-                        mixer.Sound.play(reject_sound)
+                        sound_bank.play("rejection")
                         print("Replay slot empty!")
 
             height_multiplier += 0.35
 
-        del_options_button = create_text_button(medium_font, black, "Delete Replays?", game_screen.width / 2,
+        del_options_button = create_text_button(layout.medium_font, black, "Delete Replays?", game_screen.width / 2,
                                                 game_screen.height * 0.85, slategray, lightgray, True)
 
         if del_options_button:
             delete_option = not delete_option
 
-        return_button = create_text_button(medium_font, black, "Return", game_screen.width / 1.2,
+        return_button = create_text_button(layout.medium_font, black, "Return", game_screen.width / 1.2,
                                            game_screen.height * 0.85, slategray, lightgray, False, True)
 
         if return_button:
-            main_menu()
-
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+            scenes.pop()
 
-        pygame.display.update()
-        clock.tick(15)
+        yield IDLE
 
 
 def replay_player(replay):
@@ -452,14 +710,14 @@ def replay_player(replay):
         if participant == "player":
             try:
                 move_coords = replay.player_moves[move_list_index]
-                grid_manager.grid[move_coords[0]][move_coords[1]].value = replay.player_symbol
+                grid_manager.claim_cell(tuple(move_coords), board_logic.PLAYER)
             except IndexError:
                 return True
 
         if participant == "enemy":
             try:
                 move_coords = replay.enemy_moves[move_list_index]
-                grid_manager.grid[move_coords[0]][move_coords[1]].value = replay.enemy_symbol
+                grid_manager.claim_cell(tuple(move_coords), board_logic.ENEMY)
             except IndexError:
                 return True
         return False
@@ -470,27 +728,32 @@ def replay_player(replay):
 
     replay_complete = False  # True if we have reached the end of one of the move lists
 
-    turn_timer_gate: bool = False
-    turn_timer_start: int = 0
+    turn_timer_gate: bool = False  # True while the second half of a turn is waiting on its timer
 
-    while True:
+    def finish_turn():
+        nonlocal replay_complete, turn_timer_gate, move_list_index
+        replay_complete = cycle_turn('enemy') if replay.priority else cycle_turn('player')
+        turn_timer_gate = False
+        move_list_index += 1
 
-        game_screen.screen.fill((210, 90, 55))
+    while True:
+        renderer.begin_frame((210, 90, 55))
 
         header_string = "Start" if move_list_index == 0 else f"Turn {move_list_index}" if not replay_complete \
             else f"Complete"
-        create_onscreen_text(large_font, black, header_string, game_screen.width / 2, game_screen.height / 50, True)
+        create_onscreen_text(layout.large_font, black, header_string, game_screen.width / 2, game_screen.height / 50,
+                             True)
 
-        create_onscreen_text(medium_font, black, "Player", game_screen.width * 0.05, game_screen.height * 0.25)
-        create_onscreen_text(medium_font, black, f"{replay.player_symbol}", game_screen.width * 0.05,
+        create_onscreen_text(layout.medium_font, black, "Player", game_screen.width * 0.05, game_screen.height * 0.25)
+        create_onscreen_text(layout.medium_font, black, f"{replay.player_symbol}", game_screen.width * 0.05,
                              game_screen.height * 0.32)
-        create_onscreen_text(medium_font, black, "CPU", game_screen.width * 0.05, game_screen.height * 0.42)
-        create_onscreen_text(medium_font, black, f"{replay.enemy_symbol}", game_screen.width * 0.05,
+        create_onscreen_text(layout.medium_font, black, "CPU", game_screen.width * 0.05, game_screen.height * 0.42)
+        create_onscreen_text(layout.medium_font, black, f"{replay.enemy_symbol}", game_screen.width * 0.05,
                              game_screen.height * 0.50)
 
         grid_manager.blit_grid()
 
-        progress_button = create_text_button(intermediate_font, black if not turn_timer_gate else white,
+        progress_button = create_text_button(layout.intermediate_font, black if not turn_timer_gate else white,
                                              "Progress", game_screen.width / 2, game_screen.height * 0.88,
                                              slategray if not turn_timer_gate else black,
                                              lightgray if not turn_timer_gate else black,
@@ -501,15 +764,10 @@ def replay_player(replay):
             print("Progress game replay 1 turn")
             replay_complete = cycle_turn('player') if replay.priority else cycle_turn('enemy')
             turn_timer_gate = True
-            turn_timer_start = pygame.time.get_ticks()
-
-        current_time = pygame.time.get_ticks()
-        if turn_timer_gate and current_time - turn_timer_start >= 1000 and not replay_complete:
-            replay_complete = cycle_turn('enemy') if replay.priority else cycle_turn('player')
-            turn_timer_gate = False
-            move_list_index += 1
+            if not replay_complete:
+                timers.schedule("replay_turn", 1000, finish_turn)
 
-        reset_button = create_text_button(medium_font, black, "Reset", game_screen.width / 65,
+        reset_button = create_text_button(layout.medium_font, black, "Reset", game_screen.width / 65,
                                           game_screen.height * 0.88, slategray, lightgray, False, True)
 
         if reset_button:
@@ -518,63 +776,59 @@ def replay_player(replay):
             grid_manager.generate_replay_grid(replay)
             move_list_index = 0
             replay_complete = False
-            turn_timer_gate: bool = False
-            turn_timer_start: int = 0
+            turn_timer_gate = False
+            timers.cancel("replay_turn")
 
-        return_button = create_text_button(medium_font, black, "Return", game_screen.width / 1.18,
+        return_button = create_text_button(layout.medium_font, black, "Return", game_screen.width / 1.18,
                                            game_screen.height * 0.88, slategray, lightgray, False, True)
 
         if return_button:
+            timers.cancel("replay_turn")
             grid_manager.grid = []  # Resetting the grid state
-            main_menu()
+            scenes.reset(main_menu())
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        pygame.display.update()
-        clock.tick(15)
+        yield IDLE
 
 
 def symbol_selection():
 
     player_symbol_var = f"{GameHandler.player_symbol}"  # Empty string that will hold the user's input
     player_box_active = False
-    player_var_x = game_screen.width * 0.28
-
-    var_y = game_screen.height * 0.4
 
     enemy_symbol_var = f"{GameHandler.enemy_symbol}"  # Empty string that will hold the user's input
     enemy_box_active = False
-    enemy_var_x = game_screen.width * 0.68
-
-    example_surface = xl_font.render("A", True, black)
 
     while True:
+        renderer.begin_frame((55, 195, 120))
+
+        # Positions are worked out every frame, as the resolution can change while this screen is open
+        player_var_x = game_screen.width * 0.28
+        enemy_var_x = game_screen.width * 0.68
+        var_y = game_screen.height * 0.4
 
-        game_screen.screen.fill((55, 195, 120))
+        example_surface = text_cache.render(layout.xl_font, "A", black)
 
-        create_onscreen_text(large_font, black, "Symbol Select", game_screen.width / 2, game_screen.height * 0.05, True)
+        create_onscreen_text(layout.large_font, black, "Symbol Select", game_screen.width / 2,
+                             game_screen.height * 0.05, True)
 
-        create_onscreen_text(medium_font, black, "Player", player_var_x * 0.96, game_screen.height * 0.3)
-        create_onscreen_text(medium_font, black, "CPU", enemy_var_x * 0.99, game_screen.height * 0.3)
+        create_onscreen_text(layout.medium_font, black, "Player", player_var_x * 0.96, game_screen.height * 0.3)
+        create_onscreen_text(layout.medium_font, black, "CPU", enemy_var_x * 0.99, game_screen.height * 0.3)
 
-        create_onscreen_text(xl_font, black, player_symbol_var, player_var_x, var_y)
-        create_onscreen_text(xl_font, black, enemy_symbol_var, enemy_var_x, var_y)
+        create_onscreen_text(layout.xl_font, black, player_symbol_var, player_var_x, var_y)
+        create_onscreen_text(layout.xl_font, black, enemy_symbol_var, enemy_var_x, var_y)
 
         player_box_border = pygame.Rect(player_var_x - (game_screen.height / 72), var_y, example_surface.get_width() +
-                                        24, example_surface.get_height() + 16)
+                                        game_screen.width / 45, example_surface.get_height() + game_screen.height / 45)
         enemy_box_border = pygame.Rect(enemy_var_x - (game_screen.height / 72), var_y, example_surface.get_width() +
-                                       24, example_surface.get_height() + 16)
+                                       game_screen.width / 45, example_surface.get_height() + game_screen.height / 45)
 
-        return_button = create_text_button(medium_font, black, "main menu", game_screen.width / 2,
+        return_button = create_text_button(layout.medium_font, black, "main menu", game_screen.width / 2,
                                            game_screen.height * 0.8, slategray, lightgray, True)
 
         if return_button:
-            main_menu()
+            scenes.reset(main_menu())
 
-        submit_button = create_text_button(medium_font, black, "confirm", game_screen.width / 2,
+        submit_button = create_text_button(layout.medium_font, black, "confirm", game_screen.width / 2,
                                            game_screen.height * 0.6, slategray, lightgray, True)
 
         if submit_button:
@@ -584,10 +838,7 @@ def symbol_selection():
                 if len(enemy_symbol_var) == 1 and enemy_symbol_var != GameHandler.enemy_symbol:
                     GameHandler.enemy_symbol = enemy_symbol_var
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        for evnt in frame_events.events:
             if evnt.type == pygame.MOUSEBUTTONDOWN:
                 if player_box_border.collidepoint(evnt.pos):
                     player_box_active = not player_box_active
@@ -618,78 +869,75 @@ def symbol_selection():
                         enemy_symbol_var = evnt.unicode
 
         if player_box_active:
-            pygame.draw.rect(game_screen.screen, white, player_box_border, 2)
+            renderer.rect(white, player_box_border, 2)
         else:
-            pygame.draw.rect(game_screen.screen, slategray, player_box_border, 2)
+            renderer.rect(slategray, player_box_border, 2)
 
         if enemy_box_active:
-            pygame.draw.rect(game_screen.screen, white, enemy_box_border, 2)
+            renderer.rect(white, enemy_box_border, 2)
         else:
-            pygame.draw.rect(game_screen.screen, slategray, enemy_box_border, 2)
+            renderer.rect(slategray, enemy_box_border, 2)
 
-        pygame.display.update()
-        clock.tick(15)
+        yield IDLE
 
 
 def save_settings():
 
     while True:
+        renderer.begin_frame((85, 165, 180))
 
-        game_screen.screen.fill((85, 165, 180))
-
-        create_onscreen_text(large_font, black, "Save Menu", game_screen.width / 2, game_screen.height * 0.05, True)
+        create_onscreen_text(layout.large_font, black, "Save Menu", game_screen.width / 2, game_screen.height * 0.05,
+                             True)
 
-        save_button = create_text_button(intermediate_font, black, "Save Progress", game_screen.width / 2,
+        save_button = create_text_button(layout.intermediate_font, black, "Save Progress", game_screen.width / 2,
                                          game_screen.height * 0.25, slategray, lightgray, True, False)
 
         if save_button:
-            confirm_sound = mixer.Sound("audio/win.wav")
-            mixer.Sound.play(confirm_sound)
+            sound_bank.play("win")
             save_file["Wins"] = DataTracker.wins
             save_file["Losses"] = DataTracker.losses
             save_file["Ties"] = DataTracker.ties
 
-        return_button = create_text_button(medium_font, black, "main menu", game_screen.width / 2,
+        return_button = create_text_button(layout.medium_font, black, "main menu", game_screen.width / 2,
                                            game_screen.height * 0.5, slategray, lightgray, True)
 
         if return_button:
-            main_menu()
+            scenes.reset(main_menu())
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        yield IDLE
 
-        pygame.display.update()
-        clock.tick(15)
 
+def build_sound_menu_layer(layer: pygame.Surface):
 
-def sound_menu():
+    layer.fill(thistle_green)
 
-    title_text = large_font.render("Options Menu", True, blackish)
+    title_text = text_cache.render(layout.large_font, "Options Menu", blackish)
+    layer.blit(title_text, ((game_screen.width - title_text.get_width()) / 2, 0))
 
-    volume_controls_height = game_screen.height / 2.8
+
+def sound_menu():
 
     while True:
-        game_screen.screen.fill(thistle_green)
-        game_screen.screen.blit(title_text, ((game_screen.width - title_text.get_width()) / 2, 0))
+        renderer.begin_frame(background_layers.get("sound_menu", build_sound_menu_layer))
 
-        music_button = create_text_button(medium_font, white, "Toggle Music", game_screen.width / 1.97,
+        volume_controls_height = game_screen.height / 2.8
+
+        music_button = create_text_button(layout.medium_font, white, "Toggle Music", game_screen.width / 1.97,
                                           game_screen.height / 6.5, lightgray, slategray, True)
         if music_button:
             music_object.music_toggle()
 
         music_pause_declaration = "Yes" if music_object.music_paused else "No"
-        create_onscreen_text(medium_font, black, f"Music Paused: " + music_pause_declaration, game_screen.width / 2,
-                             game_screen.height / 3.8, True)
+        create_onscreen_text(layout.medium_font, black, f"Music Paused: " + music_pause_declaration,
+                             game_screen.width / 2, game_screen.height / 3.8, True)
 
-        create_onscreen_text(medium_font, black, f"{music_object.volume_level}", game_screen.width / 2,
-                             volume_controls_height - 15, True)
+        create_onscreen_text(layout.medium_font, black, f"{music_object.volume_level}", game_screen.width / 2,
+                             volume_controls_height - game_screen.height / 48, True)
 
-        volume_up_button = create_text_button(small_font, white, "Volume +", game_screen.width / 2.3,
+        volume_up_button = create_text_button(layout.small_font, white, "Volume +", game_screen.width / 2.3,
                                               volume_controls_height, slategray, lightgray, True)
 
-        volume_down_button = create_text_button(small_font, white, "Volume -", game_screen.width / 1.75,
+        volume_down_button = create_text_button(layout.small_font, white, "Volume -", game_screen.width / 1.75,
                                                 volume_controls_height, slategray, lightgray, True)
 
         if volume_up_button:
@@ -700,10 +948,10 @@ def sound_menu():
             music_object.change_music_volume(-10)
 
         if music_object.volume_level == 0:
-            create_onscreen_text(medium_font, thunderbird_red, "(muted)", game_screen.width / 2,
-                                 volume_controls_height + 25, True)
+            create_onscreen_text(layout.medium_font, thunderbird_red, "(muted)", game_screen.width / 2,
+                                 volume_controls_height + game_screen.height / 29, True)
 
-        music_changer = create_text_button(intermediate_font, white, "Change Music Track", game_screen.width / 2,
+        music_changer = create_text_button(layout.intermediate_font, white, "Change Music Track", game_screen.width / 2,
                                            game_screen.height / 2, slategray, lightgray, True)
 
         if music_changer:
@@ -711,68 +959,67 @@ def sound_menu():
             music_object.cycle_track()
 
         current_track_name = music_object.tracklist[music_object.current_track_index][6:-4]
-        create_onscreen_text(sml_med_font, blackish, f"Current Track: {current_track_name}", game_screen.width / 2,
-                             game_screen.height / 1.6, True)
+        create_onscreen_text(layout.sml_med_font, blackish, f"Current Track: {current_track_name}",
+                             game_screen.width / 2, game_screen.height / 1.6, True)
+
+        resolution_button = create_text_button(layout.small_font, white,
+                                               f"Screen Size: {game_screen.width}x{game_screen.height}",
+                                               game_screen.width / 2, game_screen.height / 1.42, slategray, lightgray,
+                                               True)
 
-        return_button = create_text_button(intermediate_font, white, "Return", game_screen.width / 2,
+        if resolution_button:
+            game_screen.resize_screen()
+
+        return_button = create_text_button(layout.intermediate_font, white, "Return", game_screen.width / 2,
                                            game_screen.height / 1.25, slategray, lightgray, True)
 
         if return_button:
-            if GameHandler.game_status == "pregame":
-                main_menu()
-            elif GameHandler.game_status == "ongoing":
-                connect_game()
+            scenes.pop()  # Back to the title screen, the main menu or the game in progress
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        yield IDLE
 
-        pygame.display.update()
-        clock.tick(15)
 
+def build_mode_selection_layer(layer: pygame.Surface):
 
-def mode_selection():
+    layer.fill((100, 200, 200))
 
-    while True:
-        game_screen.screen.fill((100, 200, 200))
+    create_onscreen_text(layout.intermediate_font, black, "Select A Mode", game_screen.width / 2,
+                         game_screen.height / 25, True, layer)
 
-        create_onscreen_text(intermediate_font, black, "Select A Mode", game_screen.width / 2,
-                             game_screen.height / 25, True)
 
-        game_mode_list = [connect4, connect3, wide_boi, tall_boi, tic_tac_toe, cheese_crackers, deluxe]
+def mode_selection():
+
+    while True:
+        renderer.begin_frame(background_layers.get("mode_selection", build_mode_selection_layer))
 
         base_height = game_screen.height * 0.18
         height_multiplier = 1
 
         for index, mode in enumerate(game_mode_list, 1):
-            button = create_text_button(sml_med_font, white, f"{index}. {mode.title}", game_screen.width / 4,
+            button = create_text_button(layout.sml_med_font, white, f"{index}. {mode.title}", game_screen.width / 4,
                                         base_height * height_multiplier, lighter_green, green, False)
             if button:
                 GridManager.grid = []
                 GameHandler.current_mode = mode
-                coin_flip()
+                scenes.replace(coin_flip())
 
             height_multiplier += 0.5
 
-        back_button = create_text_button(medium_font, black, "Back", game_screen.width * .73,
+        back_button = create_text_button(layout.medium_font, black, "Back", game_screen.width * .73,
                                          game_screen.height * 0.8, (250, 0, 0), (180, 0, 0), True)
         if back_button:
-            main_menu()
+            scenes.pop()
 
-        music_button = create_text_button(sml_med_font, blackish, "Toggle Music", game_screen.width * .88,
+        music_button = create_text_button(layout.sml_med_font, blackish, "Toggle Music", game_screen.width * .88,
                                           game_screen.height * 0.81, lightgray, slategray, True)
 
         if music_button:
             music_object.music_toggle()
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        yield IDLE
+
 
-        pygame.display.update()
-        clock.tick(15)
+coin_flip_frames: list[pygame.Surface] = []  # The coin toss animation, filled by coin_flip()
 
 
 def coin_flip():
@@ -786,23 +1033,24 @@ def coin_flip():
     player_call = None
     coin_flip_result = None
 
-    coin_flip_frames = []
-    while flip_frame_counter <= 14:
-        coin_flip_frame_directory = f"images/coin-toss-frames/{flip_frame_counter}.png"
-        coin_flip_frames.append(coin_flip_frame_directory)
-        flip_frame_counter += 1
+    # The frames are decoded the first time a coin is flipped and the same surfaces are drawn on every toss after
+    if not coin_flip_frames:
+        while flip_frame_counter <= 14:
+            coin_flip_frame_directory = f"images/coin-toss-frames/{flip_frame_counter}.png"
+            coin_flip_frames.append(pygame.image.load(coin_flip_frame_directory).convert_alpha())
+            flip_frame_counter += 1
 
     current_frame_index = 0  # To follow the current state of the animation inside the loop
     number_of_iterations = 0  # Track the number of times that the animation has been completed
 
     while True:
+        renderer.begin_frame((90, 130, 50))
 
-        game_screen.screen.fill((90, 130, 50))
-
-        create_onscreen_text(medium_font, white, coin_flip_text, game_screen.width/2, game_screen.height * 0.08, True)
+        create_onscreen_text(layout.medium_font, white, coin_flip_text, game_screen.width/2, game_screen.height * 0.08,
+                             True)
 
-        heads_button = create_text_button(intermediate_font, black, "HEADS", game_screen.width/7, game_screen.height *
-                                          0.2, lighter_red if not flip_choice_made else slategray,
+        heads_button = create_text_button(layout.intermediate_font, black, "HEADS", game_screen.width/7,
+                                          game_screen.height * 0.2, lighter_red if not flip_choice_made else slategray,
                                           red if not flip_choice_made else slategray, False, False)
 
         if heads_button:
@@ -810,8 +1058,8 @@ def coin_flip():
                 flip_choice_made = True
                 player_call = "Heads"
 
-        tails_button = create_text_button(intermediate_font, black, "TAILS", game_screen.width / 2.6, game_screen.height
-                                          * 0.2, lighter_red if not flip_choice_made else slategray,
+        tails_button = create_text_button(layout.intermediate_font, black, "TAILS", game_screen.width / 2.6,
+                                          game_screen.height * 0.2, lighter_red if not flip_choice_made else slategray,
                                           red if not flip_choice_made else slategray, False, False)
 
         if tails_button:
@@ -820,39 +1068,32 @@ def coin_flip():
                 player_call = "Tails"
 
         if heads_button or tails_button:
-            coin_sound = mixer.Sound('audio/coin-flip.wav')
-            mixer.Sound.play(coin_sound)
+            sound_bank.play("coin_flip")
             coin_flip_result = random.choice(["Heads", "Tails"])
 
         if not flip_choice_made:
-            game_screen.screen.blit(pygame.image.load(coin_flip_frames[0]), (game_screen.width / 9,
-                                                                             game_screen.height / 3.2))
+            renderer.blit(coin_flip_frames[0], (game_screen.width / 9, game_screen.height / 3.2))
 
         if flip_choice_made:
-            create_onscreen_text(medium_font, white, f"You have chosen {player_call}", game_screen.width * 0.62,
+            create_onscreen_text(layout.medium_font, white, f"You have chosen {player_call}", game_screen.width * 0.62,
                                  game_screen.height * 0.35)
-            game_screen.screen.blit(pygame.image.load(coin_flip_frames[current_frame_index]), (game_screen.width/9,
-                                                                                               game_screen.height/3.2))
+            renderer.blit(coin_flip_frames[current_frame_index], (game_screen.width/9, game_screen.height/3.2))
             current_frame_index += 1
             if current_frame_index >= len(coin_flip_frames) - 2:
                 current_frame_index = 0
                 number_of_iterations += 1
             result_text = "flipping..." if number_of_iterations < 3 else f"The result is... {coin_flip_result}!"
-            create_onscreen_text(medium_font, white, result_text, game_screen.width * 0.62, game_screen.height / 2)
+            create_onscreen_text(layout.medium_font, white, result_text, game_screen.width * 0.62,
+                                 game_screen.height / 2)
             win_loss_insert = "won" if player_call == coin_flip_result else "lost"
             GameHandler.priority = True if win_loss_insert == "won" else False
             win_loss_text = "" if number_of_iterations < 4 else f"You have {win_loss_insert} the coin toss!"
-            create_onscreen_text(medium_font, white, win_loss_text, game_screen.width * 0.62, game_screen.height / 1.5)
+            create_onscreen_text(layout.medium_font, white, win_loss_text, game_screen.width * 0.62,
+                                 game_screen.height / 1.5)
             if number_of_iterations > 5:
-                pre_game_rules(win_loss_insert)
+                scenes.replace(pre_game_rules(win_loss_insert))
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        pygame.display.update()
-        clock.tick(8)
+        yield 8 if flip_choice_made else IDLE
 
 
 def pre_game_rules(flip_status):
@@ -871,17 +1112,21 @@ def pre_game_rules(flip_status):
                  f"anywhere on the board before your opponent does. If the board fills up before either player " \
                  f"accomplishes this objective, the game ends in a tie."
 
-    while True:
-        game_screen.screen.fill((90, 110, 150))
+    def build_pre_game_layer(layer: pygame.Surface):
 
-        create_onscreen_text(sml_med_font, white, pre_game_message, game_screen.width / 2, game_screen.height / 17,
-                             True)
+        layer.fill((90, 110, 150))
+
+        create_onscreen_text(layout.sml_med_font, white, pre_game_message, game_screen.width / 2,
+                             game_screen.height / 17, True, layer)
 
-        create_onscreen_text(sml_med_font, white, "Would you like to hear the rules?", game_screen.width / 2,
-                             game_screen.height / 9, True)
+        create_onscreen_text(layout.sml_med_font, white, "Would you like to hear the rules?", game_screen.width / 2,
+                             game_screen.height / 9, True, layer)
 
-        yes_button = create_text_button(intermediate_font, black, "YES", game_screen.width / 4, game_screen.height *
-                                        0.2, lighter_red if not rules_choice_made else slategray,
+    while True:
+        renderer.begin_frame(background_layers.get(f"pre_game_rules {flip_status}", build_pre_game_layer))
+
+        yes_button = create_text_button(layout.intermediate_font, black, "YES", game_screen.width / 4,
+                                        game_screen.height * 0.2, lighter_red if not rules_choice_made else slategray,
                                         red if not rules_choice_made else slategray, False)
 
         if yes_button:
@@ -889,8 +1134,8 @@ def pre_game_rules(flip_status):
                 rules_choice_made = True
                 display_rules = True
 
-        no_button = create_text_button(intermediate_font, black, "NO", game_screen.width / 1.5, game_screen.height
-                                       * 0.2, lighter_red if not rules_choice_made else slategray,
+        no_button = create_text_button(layout.intermediate_font, black, "NO", game_screen.width / 1.5,
+                                       game_screen.height * 0.2, lighter_red if not rules_choice_made else slategray,
                                        red if not rules_choice_made else slategray, False)
 
         if no_button:
@@ -898,77 +1143,69 @@ def pre_game_rules(flip_status):
                 rules_choice_made = True
 
         if display_rules:
-            display_text_over_multiple_lines(game_rules, sml_med_font, 50, game_screen.width / 4,
+            display_text_over_multiple_lines(game_rules, layout.sml_med_font, 50, game_screen.width / 4,
                                              game_screen.height * 0.4, 0.15)
         if not display_rules and rules_choice_made:
-            create_onscreen_text(sml_med_font, black, "Fine, be that way...", game_screen.width / 4,
+            create_onscreen_text(layout.sml_med_font, black, "Fine, be that way...", game_screen.width / 4,
                                  game_screen.height * 0.4)
 
-        proceed_button = create_text_button(large_font, black, "Proceed To The Game", game_screen.width/2,
+        proceed_button = create_text_button(layout.large_font, black, "Proceed To The Game", game_screen.width/2,
                                             game_screen.height*0.8, (90, 90, 255), (90, 90, 180), True)
 
         if proceed_button:
-            connect_game()
-
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+            scenes.replace(connect_game())
 
-        pygame.display.update()
-        clock.tick(8)
+        yield IDLE
 
 
 def connect_game():
 
-    GameHandler.game_status = "ongoing"
-
-    GameHandler.player_turn = True if GameHandler.priority else False
+    if GameHandler.game_status != "ongoing":
+        GameHandler.game_status = "ongoing"
+        GameHandler.player_turn = True if GameHandler.priority else False
 
     grid_manager.generate_grid()  # Creating the grid
 
-    while True:
+    if not GameHandler.player_turn:
+        begin_enemy_turn()
+
+    post_game_scheduled = False  # The finished board stays up for a moment so the winning line can be seen
+    post_game_due = False
 
-        game_screen.screen.fill(thistle_green)
+    def show_post_game():
+        nonlocal post_game_due
+        post_game_due = True
+
+    while True:
+        renderer.begin_frame(background_layers.get("connect_game", lambda layer: layer.fill(thistle_green)))
 
-        create_onscreen_text(intermediate_font, (0, 200, 0), "Player Turn", game_screen.width / 2,
+        create_onscreen_text(layout.intermediate_font, (0, 200, 0), "Player Turn", game_screen.width / 2,
                              game_screen.height * 0.01, True) if GameHandler.player_turn else \
-            create_onscreen_text(intermediate_font, red, "CPU Turn", game_screen.width / 2, game_screen.height * 0.01,
-                                 True)
+            create_onscreen_text(layout.intermediate_font, red, "CPU Turn", game_screen.width / 2,
+                                 game_screen.height * 0.01, True)
 
-        music_toggle = create_text_button(small_font, thunderbird_red, "Toggle Music", game_screen.width * .86,
+        music_toggle = create_text_button(layout.small_font, thunderbird_red, "Toggle Music", game_screen.width * .86,
                                           game_screen.height * 0.90, blackish, black, False)
 
         if music_toggle:
             music_object.music_toggle()
 
-        options_button = create_text_button(sml_med_font, white, "Options Menu", game_screen.width * .85, 0,
+        options_button = create_text_button(layout.sml_med_font, white, "Options Menu", game_screen.width * .85, 0,
                                             (0, 200, 0), green, False)
 
         if options_button:
-            sound_menu()
+            scenes.push(sound_menu())
 
         grid_manager.blit_grid()  # Displaying the grid, also contains the cells and their interactions
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        pygame.display.update()  # Updating the game display
-        clock.tick(60)  # Frame-rate
-
-        for symbol in [GameHandler.player_symbol, GameHandler.enemy_symbol]:
-            win_loss_check(symbol)
+        if GameHandler.game_status in ["won", "lost", "tied"] and not post_game_scheduled:
+            timers.schedule("post_game", POST_GAME_DELAY, show_post_game)
+            post_game_scheduled = True
 
-        if not GameHandler.player_turn:
-            if not GameHandler.time_taken:
-                GameHandler.enemy_turn_start_time = pygame.time.get_ticks()
-                GameHandler.time_taken = True
-            enemy_turn()
+        if post_game_due:
+            scenes.replace(post_game())
 
-        if GameHandler.game_status in ["won", "lost", "tied"]:
-            post_game()
+        yield GAME_IDLE  # The CPU's turn and the pause after the last move end on timers, which wake the frame loop
 
 
 def post_game():
@@ -977,24 +1214,20 @@ def post_game():
 
     replay_saved = False
 
-    win_sound = mixer.Sound("audio/win.wav")
-    lose_sound = mixer.Sound("audio/lose.wav")
-    tie_sound = mixer.Sound("audio/tie.mp3")
-
     if GameHandler.game_status == "won":
-        mixer.Sound.play(win_sound)
+        sound_bank.play("win")
     elif GameHandler.game_status == "lost":
-        mixer.Sound.play(lose_sound)
+        sound_bank.play("lose")
     elif GameHandler.game_status == "tied":
-        mixer.Sound.play(tie_sound)
+        sound_bank.play("tie")
 
     while True:
+        renderer.begin_frame((55, 195, 120))
 
-        game_screen.screen.fill((55, 195, 120))
-
-        create_onscreen_text(large_font, black, header_message, game_screen.width / 2, game_screen.height * 0.05, True)
+        create_onscreen_text(layout.large_font, black, header_message, game_screen.width / 2, game_screen.height * 0.05,
+                             True)
 
-        replay_button = create_text_button(intermediate_font, black if not replay_saved else white,
+        replay_button = create_text_button(layout.intermediate_font, black if not replay_saved else white,
                                            "Save Replay?" if not replay_saved else "Saved",
                                            game_screen.width / 2, game_screen.height * 0.4,
                                            slategray if not replay_saved else black,
@@ -1014,804 +1247,190 @@ def post_game():
                     replay_saved = True
                     break
 
-            create_onscreen_text(medium_font, black, "Done", game_screen.width / 2, game_screen.height * 0.65, True)
+            create_onscreen_text(layout.medium_font, black, "Done", game_screen.width / 2, game_screen.height * 0.65,
+                                 True)
 
-        return_button = create_text_button(medium_font, black, "main menu", game_screen.width / 2,
+        return_button = create_text_button(layout.medium_font, black, "main menu", game_screen.width / 2,
                                            game_screen.height * 0.8, slategray, lightgray, True)
 
         if return_button:
             post_game_reset()
-            main_menu()
+            scenes.reset(main_menu())
 
-        for evnt in pygame.event.get():
-            if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        pygame.display.update()
-        clock.tick(15)
+        yield IDLE
 # ----------------------------------------------------------------------------------------------------------------------
 # Connect X Gameplay Logic
 
 
-class GridCell:  # Currently generated inside the GridManager.generate_and_blit_grid() method
-    def __init__(self, cid: tuple[int, int], pos_factors: tuple[float, float]):
+class GridCell:
+
+    # The on-screen view of one cell. What the cell holds is kept in the grid manager's BoardState, one byte per cell,
+    # so a view only knows where it is and whether the mouse was over it on the last frame
+
+    __slots__ = ("cid", "game_mode", "is_hovered")
+
+    def __init__(self, cid: tuple[int, int], game_mode):
         self.cid = cid
-        self.value = ""
-        self.position_factors = pos_factors  # The game-mode-dependent offsets that cells are generated with
-        self.width = GameHandler.current_mode.cell_width
-        self.height = GameHandler.current_mode.cell_height
-        self.x = None
-        self.y = None
-
-        self.is_victory_cell = False  # To single out a few to be highlighted when a game is won
+        self.game_mode = game_mode
         self.is_hovered = False
 
-    def generate_cell_on_board(self):
+    @property
+    def rect(self) -> pygame.Rect:  # The cell's place on screen at the current resolution
+        return layout.cell_rects(self.game_mode)[self.cid]
 
-        mouse = pygame.mouse.get_pos()
+    def generate_cell_on_board(self, is_claimed: bool, is_victory_cell: bool):
 
-        x = game_screen.width * self.position_factors[0]
-        y = game_screen.height * self.position_factors[1]
-        self.x, self.y = x, y
+        mouse = pygame.mouse.get_pos()
 
-        outline_rect = pygame.Rect(x, y, self.width, self.height)
+        outline_rect = self.rect
+        x, y, width, height = outline_rect
 
-        if x + self.width > mouse[0] > x and y + self.height > mouse[1] > y and GameHandler.player_turn == True:
-            pygame.draw.rect(game_screen.screen, white, outline_rect, int(game_screen.height / 360))
+        if x + width > mouse[0] > x and y + height > mouse[1] > y and GameHandler.player_turn == True:
+            renderer.rect(white, outline_rect, layout.outline_width)
             if not self.is_hovered:
-                hover_sound = mixer.Sound('audio/button_click.mp3')
-                mixer.Sound.play(hover_sound)
+                sound_bank.play("button_click")
                 self.is_hovered = True
-            for evnt in pygame.event.get():
-                if evnt.type == pygame.MOUSEBUTTONUP and not self.value:  # Detecting clicks
-                    return x, y, self.width, self.height
-                elif evnt.type == pygame.MOUSEBUTTONUP and self.value:
-                    rejection_sound = mixer.Sound('audio/rejection.wav')
-                    mixer.Sound.play(rejection_sound)
-        elif x + self.width > mouse[0] > x and y + self.height > mouse[1] > y and GameHandler.player_turn == False:
-            pygame.draw.rect(game_screen.screen, red, outline_rect, int(game_screen.height / 360))
+            for evnt in frame_events.events:
+                if evnt.type == pygame.MOUSEBUTTONUP and not is_claimed:  # Detecting clicks
+                    frame_events.consume(evnt)
+                    return x, y, width, height
+                elif evnt.type == pygame.MOUSEBUTTONUP and is_claimed:
+                    sound_bank.play("rejection")
+        elif x + width > mouse[0] > x and y + height > mouse[1] > y and GameHandler.player_turn == False:
+            renderer.rect(red, outline_rect, layout.outline_width)
             if not self.is_hovered:
-                hover_sound = mixer.Sound('audio/button_click.mp3')
-                mixer.Sound.play(hover_sound)
+                sound_bank.play("button_click")
                 self.is_hovered = True
-            for evnt in pygame.event.get():
+            for evnt in frame_events.events:
                 if evnt.type == pygame.MOUSEBUTTONUP:  # Detecting clicks
-                    rejection_sound = mixer.Sound('audio/rejection.wav')
-                    mixer.Sound.play(rejection_sound)
+                    sound_bank.play("rejection")
         else:  # Non-hover
             self.is_hovered = False
-            pygame.draw.rect(game_screen.screen, black, outline_rect, int(game_screen.height / 360))
+            renderer.rect(green if is_victory_cell else black, outline_rect, layout.outline_width)
 
-    def draw_cell_value(self):
-        create_onscreen_text(GameHandler.current_mode.font, black, self.value, self.x + (self.width / 3),
-                             self.y + (self.height / 6))
+    def draw_cell_value(self, symbol: str):
+        x, y, width, height = self.rect
+        create_onscreen_text(layout.font(self.game_mode.font), black, symbol, x + (width / 3), y + (height / 6))
 
 
 class GridManager:
 
     def __init__(self, grid: list[list[GridCell]]):
         self.grid = grid
+        self.board_state: board_logic.BoardState | None = None  # The contents of every cell, built alongside the grid
+        self.symbols = ["", "X", "O"]  # The symbol drawn for each side, indexed by EMPTY, PLAYER and ENEMY
+        self.victory_cells: set[tuple[int, int]] = set()  # To single out a few to be highlighted when a game is won
 
-    def generate_grid(self):
-        grid: list[list] = []
-        y_offset_factor = GameHandler.current_mode.cell_y_offset  # Vertical Spacing
-        for row in range(GameHandler.current_mode.board.shape[0]):
-
-            x_offset_factor = GameHandler.current_mode.cell_x_offset  # Horizontal spacing
-            grid_row: list = []  # The rows of the overall grid that will be inserted
-
-            for col in range(GameHandler.current_mode.board.shape[1]):
-
-                cell = GridCell((row, col), (x_offset_factor, y_offset_factor))
-                grid_row.append(cell)
-                x_offset_factor += GameHandler.current_mode.x_offset_step
-
-            grid.append(grid_row)
-            y_offset_factor += GameHandler.current_mode.y_offset_step
+    def build_grid(self, game_mode, player_symbol: str, enemy_symbol: str):
+        self.grid = [[GridCell((row, col), game_mode) for col in range(game_mode.board.shape[1])]
+                     for row in range(game_mode.board.shape[0])]  # Positioned by the layout (Layout.cell_rects)
+        self.board_state = board_logic.BoardState(game_mode.geometry)
+        self.symbols = ["", player_symbol, enemy_symbol]
+        self.victory_cells = set()
 
+    def generate_grid(self):
         if not self.grid:
             print("The game grid is currently empty. Building...")
-            self.grid = grid
+            self.build_grid(GameHandler.current_mode, GameHandler.player_symbol, GameHandler.enemy_symbol)
 
     def generate_replay_grid(self, replay):
-        grid: list[list[GridCell]] = []
-        y_offset_factor = replay.game_mode.cell_y_offset
-        for row in range(replay.game_mode.board.shape[0]):
-
-            x_offset_factor = replay.game_mode.cell_x_offset
-            grid_row: list[GridCell] = []
-
-            for col in range(replay.game_mode.board.shape[1]):
-
-                cell = GridCell((row, col), (x_offset_factor, y_offset_factor))
-                grid_row.append(cell)
-                x_offset_factor += replay.game_mode.x_offset_step
-
-            grid.append(grid_row)
-            y_offset_factor += replay.game_mode.y_offset_step
-
         if not self.grid:
             print("Generating replay grid...")
-            self.grid = grid
+            self.build_grid(replay.game_mode, replay.player_symbol, replay.enemy_symbol)
+
+    def claim_cell(self, cid: tuple[int, int], side: int):
+        self.board_state.claim(cid, side)
 
     def blit_grid(self):
         if not self.grid:
             print("The game grid does not exist, something went wrong. Resetting.")
-            main()
+            scenes.reset(title_screen())
+            return
+        cells = self.board_state.cells
         for row in self.grid:
             for cell in row:
-                physical_cell = cell.generate_cell_on_board()
-                if cell.value:
-                    cell.draw_cell_value()
+                side = cells[cell.cid]
+                physical_cell = cell.generate_cell_on_board(side != board_logic.EMPTY, cell.cid in self.victory_cells)
+                if side != board_logic.EMPTY:
+                    cell.draw_cell_value(self.symbols[side])
                 if physical_cell and GameHandler.player_turn and GameHandler.game_status == "ongoing":
                     print(f"The player has claimed a cell! ({cell.cid})")
-                    stamp_sound = mixer.Sound("audio/kermite607_stamp.wav")
-                    mixer.Sound.play(stamp_sound)
-                    cell.value = GameHandler.player_symbol
+                    sound_bank.play("stamp")
+                    self.claim_cell(cell.cid, board_logic.PLAYER)
                     DataTracker.player_move_list.append(cell.cid)
                     GameHandler.player_turn = False
+                    win_loss_check(GameHandler.player_symbol, cell.cid)
+                    if GameHandler.game_status == "ongoing":
+                        begin_enemy_turn()
 
 
 grid_manager = GridManager([])
+cpu_worker = cpu_player.CpuWorker()
+ENEMY_TURN_RETRY = 50  # Milliseconds between checks on a CPU move that's still being worked out
+SEARCH_TIME_MARGIN = 300  # Milliseconds of the CPU's turn held back from its search, for starting and answering
+POST_GAME_DELAY = 1500  # Milliseconds the finished board is shown for before the post-game screen
 
 
-def enemy_turn():
-
-    goal_num: int = GameHandler.current_mode.objective  # Number of aligned squares in order to win
-
-    winning_moves: list[GridCell] = []  # Moves that can win the CPU the game
-    defensive_moves: list[GridCell] = []  # Moves that can stop the player from winning
-    optimal_moves: list[GridCell] = []  # Moves that can build towards a win
-    constructive_moves: list[GridCell] = []
-
-    current_time = pygame.time.get_ticks()
-    if current_time - GameHandler.enemy_turn_start_time >= GameHandler.enemy_turn_length \
-            and GameHandler.game_status == "ongoing":
-
-        for symbol in [GameHandler.enemy_symbol, GameHandler.player_symbol]:
-
-            # Method 1: Checking rows
-            for r_ind, row in enumerate(grid_manager.grid):
-
-                symbol_count = 0
-                for c_ind, cell in enumerate(row):
-                    if cell.value == symbol:
-                        symbol_count += 1
-                    else:  # Reset the count
-                        symbol_count = 0
-                    if symbol_count == goal_num - 1 or 2 <= symbol_count < goal_num - 1 and \
-                            symbol == GameHandler.enemy_symbol:
-
-                        fail_roll = random.randint(1, 100)  # Chance for CPU to do nothing
-                        if fail_roll > GameHandler.difficulty:  # CPU does act
-
-                            # The far (rightmost) space
-                            if symbol_count == goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind][c_ind + 1].value:  # Cell exists and is valueless
-                                        if symbol == GameHandler.player_symbol:
-                                            print("Defensive move found")
-                                            defensive_moves.append(grid_manager.grid[r_ind][c_ind + 1])
-                                        elif symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found")
-                                            winning_moves.append(grid_manager.grid[r_ind][c_ind + 1])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                            elif 2 <= symbol_count < goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind][c_ind + 1].value:
-                                        print("Optimal move (row far)")
-                                        optimal_moves.append(grid_manager.grid[r_ind][c_ind + 1])
-                                except IndexError:
-                                    pass
-
-                            # The near (leftmost) space
-                            if symbol_count == goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind][c_ind - (goal_num - 1)].value and \
-                                            c_ind - (goal_num - 1) >= 0:
-                                        if symbol == GameHandler.player_symbol:
-                                            print("Defensive move found")
-                                            defensive_moves.append(grid_manager.grid[r_ind][c_ind - (goal_num - 1)])
-                                        elif symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found")
-                                            winning_moves.append(grid_manager.grid[r_ind][c_ind - (goal_num - 1)])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                            # Near boundary for row optimal move
-                            elif 2 <= symbol_count < goal_num - 1 and c_ind - symbol_count >= 0:
-                                try:
-                                    if not grid_manager.grid[r_ind][c_ind - symbol_count].value:
-                                        print("Optimal move (row near)")
-                                        optimal_moves.append(grid_manager.grid[r_ind][c_ind - symbol_count])
-                                except IndexError:
-                                    pass
-
-            # Method 2: Checking columns
-            col_index = 0
-            while col_index <= GameHandler.current_mode.board.shape[1] - 1:
-                symbol_count = 0
-                for r_ind, row in enumerate(grid_manager.grid):
-                    if row[col_index].value == symbol:
-                        symbol_count += 1
-                    else:
-                        symbol_count = 0
-                    if symbol_count == goal_num - 1 or 2 <= symbol_count < goal_num - 1:
-
-                        fail_roll = random.randint(1, 100)  # Chance for CPU to do nothing
-                        if fail_roll > GameHandler.difficulty:  # CPU does act
-
-                            # Check for lower end
-                            if symbol_count == goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind + 1][col_index].value:
-                                        if symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (col l)")
-                                            defensive_moves.append(grid_manager.grid[r_ind + 1][col_index])
-                                        elif symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (col l)")
-                                            winning_moves.append(grid_manager.grid[r_ind + 1][col_index])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                            # Optimal move, lower column
-                            elif 2 <= symbol_count < goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind + 1][col_index].value:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Optimal move found (lower column)")
-                                            optimal_moves.append(grid_manager.grid[r_ind + 1][col_index])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                            # Check for upper end
-                            if symbol_count == goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind - (goal_num - 1)][col_index].value and \
-                                            r_ind - (goal_num - 1) >= 0:
-                                        if symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (col u)")
-                                            defensive_moves.append(grid_manager.grid[r_ind - (goal_num - 1)][col_index])
-                                        elif symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (col u)")
-                                            winning_moves.append(grid_manager.grid[r_ind - (goal_num - 1)][col_index])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                            # Optimal move, upper column
-                            elif 2 <= symbol_count < goal_num - 1:
-                                try:
-                                    if not grid_manager.grid[r_ind - symbol_count][col_index].value and \
-                                            r_ind - symbol_count >= 0:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Optimal move found (upper column)")
-                                            optimal_moves.append(grid_manager.grid[r_ind - symbol_count][col_index])
-                                except IndexError:
-                                    pass  # If space does not exist, ignore
-
-                col_index += 1
-
-            # Method 3: Checking descending diagonals
-
-            for row_ind, row in enumerate(grid_manager.grid):
-                for col_ind, cell in enumerate(row):
-                    y = row_ind
-                    x = col_ind
-
-                    symbol_count = 0
-
-                    board_size_y = GameHandler.current_mode.board.shape[0]
-                    board_size_x = GameHandler.current_mode.board.shape[1]
-
-                    while True:
-                        if y > board_size_y - 1 or x > board_size_x - 1:  # If values were larger than grid can support
-                            break
-
-                        else:
-                            if grid_manager.grid[y][x].value == symbol:
-                                symbol_count += 1
-
-                                if symbol_count == goal_num - 1 or 2 <= symbol_count < goal_num - 1 and \
-                                        symbol == GameHandler.enemy_symbol:
-
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-
-                                        # Checking for upper boundary
-                                        if y - (goal_num - 1) >= 0 and x - (goal_num - 1) >= 0:
-
-                                            if not grid_manager.grid[y - (goal_num - 1)][x - (goal_num - 1)].value:
-
-                                                # Winning and defensive moves
-                                                if symbol_count == goal_num - 1:
-                                                    if symbol == GameHandler.player_symbol:
-                                                        print("Defensive move found (Desc. diagonal up)")
-                                                        defensive_moves.append(
-                                                            grid_manager.grid[y - (goal_num - 1)][x - (goal_num - 1)])
-                                                    elif symbol == GameHandler.enemy_symbol:
-                                                        print("Winning move found (desc. diagonal up)")
-                                                        winning_moves.append(
-                                                            grid_manager.grid[y - (goal_num - 1)][x - (goal_num - 1)])
-
-                                        # Upper boundary for optimal move
-                                        if 2 <= symbol_count < goal_num - 1 and y - symbol_count >= 0 \
-                                                and x - symbol_count >= 0:
-
-                                            if not grid_manager.grid[y - symbol_count][x - symbol_count].value:
-                                                print("Optimal move found (Desc. diagonal up)")
-                                                optimal_moves.append(
-                                                    grid_manager.grid[y - symbol_count][x - symbol_count])
-
-                                        # Checking for lower boundary
-                                        if y + 1 <= board_size_y - 1 and x + 1 <= board_size_x - 1:
-                                            if not grid_manager.grid[y + 1][x + 1].value:
-
-                                                # Winning and defensive moves
-                                                if symbol_count == goal_num - 1:
-                                                    if symbol == GameHandler.player_symbol:
-                                                        print("Defensive move found (desc. diag down")
-                                                        defensive_moves.append(grid_manager.grid[y + 1][x + 1])
-                                                    elif symbol == GameHandler.enemy_symbol:
-                                                        print("Winning move found (desc. diag down")
-                                                        winning_moves.append(grid_manager.grid[y + 1][x + 1])
-                                                        # Optimal moves
-
-                                                # Optimal moves lower boundary
-                                                elif 2 <= symbol_count < goal_num - 1:
-                                                    print("Optimal move found (Desc. diagonal down)")
-                                                    optimal_moves.append(grid_manager.grid[y + 1][x + 1])
-
-                                # Increase the coordinate values after any potential checks can be made
-                                y += 1
-                                x += 1
-
-                            else:
-                                break
-
-            # Method 4: Checking ascending diagonals
-            for row_ind, row in enumerate(grid_manager.grid):
-                for col_ind, cell in enumerate(row):
-                    y = row_ind
-                    x = col_ind
-
-                    symbol_count = 0
-
-                    board_size_y = GameHandler.current_mode.board.shape[0]
-                    board_size_x = GameHandler.current_mode.board.shape[1]
-
-                    while True:
-
-                        if y > board_size_y - 1 or x < 0:
-                            break
-
-                        else:
-                            if grid_manager.grid[y][x].value == symbol:
-                                symbol_count += 1
-                                if symbol_count == goal_num - 1 or 2 <= symbol_count < goal_num - 1:
-
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-
-                                        # Coordinates of upper diagonal bound
-                                        upper_x = x + (goal_num - 1)
-                                        upper_y = y - (goal_num - 1)
-
-                                        # Checking if the upper diagonal bound exists and is free
-                                        if upper_y >= 0 and upper_x < board_size_x and symbol_count == goal_num - 1:
-
-                                            if not grid_manager.grid[upper_y][upper_x].value:
-                                                if symbol == GameHandler.player_symbol:
-                                                    print("Defensive move found (asc diag upper)")
-                                                    defensive_moves.append(grid_manager.grid[upper_y][upper_x])
-                                                if symbol == GameHandler.enemy_symbol:
-                                                    print("Winning move found (asc diag upper)")
-                                                    winning_moves.append(grid_manager.grid[upper_y][upper_x])
-
-                                        # Checking for upper optimal move
-                                        elif y - symbol_count >= 0 and x + symbol_count < board_size_x and \
-                                                2 <= symbol_count < goal_num - 1:
-                                            if not grid_manager.grid[y - symbol_count][x + symbol_count].value and \
-                                                    symbol == GameHandler.enemy_symbol:
-                                                print("Optimal move found (asc diag upper)")
-                                                optimal_moves.append(
-                                                    grid_manager.grid[y - symbol_count][x + symbol_count])
-
-                                        # Checking if the lower diagonal bound exists and is free
-                                        if y + 1 < board_size_y and x - 1 >= 0 and not \
-                                                grid_manager.grid[y + 1][x - 1].value:
-
-                                            if symbol_count == goal_num - 1:
-                                                if symbol == GameHandler.player_symbol:
-                                                    print("Defensive move found (asc diag lower)")
-                                                    defensive_moves.append(grid_manager.grid[y + 1][x - 1])
-                                                if symbol == GameHandler.enemy_symbol:
-                                                    print("Winning move found (asc diag lower)")
-                                                    winning_moves.append(grid_manager.grid[y + 1][x - 1])
-
-                                            elif 2 <= symbol_count < goal_num - 1:
-                                                if symbol == GameHandler.enemy_symbol:
-                                                    print("Optimal move found (Optimal move found asc diag lower")
-                                                    optimal_moves.append(grid_manager.grid[y + 1][x - 1])
-
-                                # Increase the coordinate values after any potential checks can be made
-                                y += 1  # Searches for chained cells in a descending pattern
-                                x -= 1
-
-                            else:
-                                break
-
-            # Setup for fill-chain methods
-            for r_ind, row in enumerate(grid_manager.grid):
-                for c_ind, cell in enumerate(row):
-
-                    y = r_ind
-                    x = c_ind
-
-                    if grid_manager.grid[y][x].value == symbol:
-
-                        # Method 5: Checking columns for inner-chain fills
-                        try:
-
-                            mid_spaces = []
-
-                            # Checking for where the other end of the chain would be
-                            if grid_manager.grid[y + (goal_num - 1)][x].value == symbol:
-
-                                current_row = y + (goal_num - 2)
-
-                                # Cycling from the end of the chain back towards the beginning
-                                while current_row > y:
-
-                                    if grid_manager.grid[current_row][x].value == symbol:
-                                        pass  # Ignore filled spaces
-
-                                    elif grid_manager.grid[current_row][x].value and \
-                                            grid_manager.grid[current_row][x].value != symbol:
-                                        mid_spaces = []
-                                        break  # Chains with mixed characters aren't relevant (not working properly yet)
-
-                                    elif not grid_manager.grid[current_row][x].value:
-                                        mid_spaces.append(grid_manager.grid[current_row][x])
-
-                                    current_row -= 1  # Cycle to the next cell up
-
-                                if len(mid_spaces) == 1:
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (Column fill)")
-                                            winning_moves.append(mid_spaces[0])
-                                        elif symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (Column fill)")
-                                            defensive_moves.append(mid_spaces[0])
-
-                                elif len(mid_spaces) >= 2:
-                                    for fill_cell in mid_spaces:
-                                        fail_roll = random.randint(1, 100)
-                                        if fail_roll > GameHandler.difficulty:
-                                            print("Found constructive move? (column fill)")
-                                            constructive_moves.append(fill_cell)  # Might warrant a new type of move
-
-                        except IndexError:
-                            pass
-
-                        # Method 6: Checking rows for inner chain fills
-                        try:
+def resolve_enemy_turn(chosen_cid: tuple[int, int]):
+    sound_bank.play("stamp")
+    grid_manager.claim_cell(chosen_cid, board_logic.ENEMY)
+    DataTracker.enemy_move_list.append(chosen_cid)
+    print(f"The enemy has successfully selected cell {chosen_cid}!")
+    GameHandler.player_turn = True
+    win_loss_check(GameHandler.enemy_symbol, chosen_cid)
 
-                            mid_spaces = []
 
-                            if grid_manager.grid[y][x + (goal_num - 1)].value == symbol:
+def begin_enemy_turn():
 
-                                current_col = x + (goal_num - 1)
+    # The CPU's move is worked out on the CPU worker while the frame loop carries on, and a timer ends the turn. The
+    # turn length sets the pacing, and the Expert search spends most of it looking ahead. The search's clock only
+    # starts once the worker has the position, so it is given a little less than the turn to be done in time
+    time_budget = max(GameHandler.enemy_turn_length - SEARCH_TIME_MARGIN, GameHandler.enemy_turn_length / 2)
+    GameHandler.enemy_move_future = cpu_worker.submit(grid_manager.board_state, board_logic.ENEMY,
+                                                      GameHandler.cpu_engine, GameHandler.difficulty,
+                                                      time_budget / 1000)
+    timers.schedule("enemy_turn", GameHandler.enemy_turn_length, enemy_turn)
 
-                                while current_col > x:
-
-                                    if grid_manager.grid[y][current_col].value == symbol:
-                                        pass
-
-                                    elif grid_manager.grid[y][current_col].value and \
-                                            grid_manager.grid[y][current_col].value != symbol:
-                                        mid_spaces = []
-                                        break
-
-                                    elif not grid_manager.grid[y][current_col].value:
-                                        mid_spaces.append(grid_manager.grid[y][current_col])
-
-                                    current_col -= 1
-
-                                if len(mid_spaces) == 1:
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (Row fill)")
-                                            winning_moves.append(mid_spaces[0])
-                                        elif symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (Row fill)")
-                                            defensive_moves.append(mid_spaces[0])
-
-                                elif len(mid_spaces) >= 2:
-                                    for fill_cell in mid_spaces:
-                                        fail_roll = random.randint(1, 100)
-                                        if fail_roll > GameHandler.difficulty:
-                                            print("Found constructive move? (Row fill)")
-                                            constructive_moves.append(fill_cell)
-
-                        except IndexError:
-                            pass
-
-                        # Method 7: Descending diagonals
-                        try:
-
-                            mid_spaces = []
-
-                            if grid_manager.grid[y + (goal_num - 1)][x + (goal_num - 1)].value == symbol:
-
-                                row_coord = y + (goal_num - 2)
-                                col_coord = x + (goal_num - 2)
-
-                                while col_coord > x and row_coord > y:
-
-                                    if grid_manager.grid[row_coord][col_coord].value == symbol:
-                                        pass
-
-                                    elif grid_manager.grid[row_coord][col_coord].value and \
-                                            grid_manager.grid[row_coord][col_coord].value != symbol:
-                                        mid_spaces = []
-                                        break
-
-                                    elif not grid_manager.grid[row_coord][col_coord].value:
-                                        mid_spaces.append(grid_manager.grid[row_coord][col_coord])
-
-                                    row_coord -= 1
-                                    col_coord -= 1
-
-                                if len(mid_spaces) == 1:
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (Desc. Diagonal fill)")
-                                            winning_moves.append(mid_spaces[0])
-                                        elif symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (Desc. Diagonal fill)")
-                                            defensive_moves.append(mid_spaces[0])
-
-                                elif len(mid_spaces) >= 2:
-                                    for fill_cell in mid_spaces:
-                                        fail_roll = random.randint(1, 100)
-                                        if fail_roll > GameHandler.difficulty:
-                                            print("Found constructive move? (Desc. Diagonal fill)")
-                                            constructive_moves.append(fill_cell)
-
-                        except IndexError:
-                            pass
-
-                        # Method 8: Ascending diagonals
-                        try:
-                            mid_spaces = []
-
-                            if grid_manager.grid[y + (goal_num - 1)][x - (goal_num - 1)].value == symbol and \
-                                    x - (goal_num - 1) >= 0:
-
-                                col_coord = x - (goal_num - 2)
-                                row_coord = y + (goal_num - 2)
-
-                                while 0 <= col_coord < x and row_coord > y:
-
-                                    if grid_manager.grid[row_coord][col_coord].value == symbol:
-                                        pass
-
-                                    elif grid_manager.grid[row_coord][col_coord].value and \
-                                            grid_manager.grid[row_coord][col_coord].value != symbol:
-                                        mid_spaces = []
-                                        break
-                                    elif not grid_manager.grid[row_coord][col_coord].value:
-                                        mid_spaces.append(grid_manager.grid[row_coord][col_coord])
-
-                                    row_coord -= 1
-                                    col_coord += 1
-
-                                if len(mid_spaces) == 1:
-                                    fail_roll = random.randint(1, 100)
-                                    if fail_roll > GameHandler.difficulty:
-                                        if symbol == GameHandler.enemy_symbol:
-                                            print("Winning move found (Asc. Diagonal fill)")
-                                            winning_moves.append(mid_spaces[0])
-                                        elif symbol == GameHandler.player_symbol:
-                                            print("Defensive move found (Asc. Diagonal fill)")
-                                            defensive_moves.append(mid_spaces[0])
-
-                                elif len(mid_spaces) >= 2:
-                                    for fill_cell in mid_spaces:
-                                        fail_roll = random.randint(1, 100)
-                                        if fail_roll > GameHandler.difficulty:
-                                            print("Found constructive move? (Asc. Diagonal fill)")
-                                            constructive_moves.append(fill_cell)
-
-                        except IndexError:
-                            pass
-
-        # Last advanced method: Finding moves that allow the enemy to build off a single square
-        for row_ind, row in enumerate(grid_manager.grid):
-            for col_ind, cell in enumerate(row):
-                if cell.value == GameHandler.enemy_symbol:
-
-                    # Compiling all 8 potential coords of cells surrounding any given cell filled with the enemy symbol
-                    potential_cell_coords: list[tuple] = [(row_ind, col_ind - 1), (row_ind, col_ind + 1),
-                                                          (row_ind - 1, col_ind), (row_ind + 1, col_ind),
-                                                          (row_ind - 1, col_ind - 1), (row_ind + 1, col_ind + 1),
-                                                          (row_ind - 1, col_ind + 1), (row_ind + 1, col_ind - 1)]
-
-                    for coord in potential_cell_coords:
-                        if coord[0] >= 0 and coord[1] >= 0:
-
-                            fail_roll = random.randint(1, 100)
-                            if fail_roll > GameHandler.difficulty:
-
-                                try:
-                                    target_cell = grid_manager.grid[coord[0]][coord[1]]
-                                    if not target_cell.value:
-                                        constructive_moves.append(target_cell)
-                                except IndexError:
-                                    pass  # Ignore if cell doesn't exist
-
-        # Collecting existing moves from lists and executing one
-
-        def resolve_enemy_turn(chosen_cell):
-            stamp_sound = mixer.Sound("audio/kermite607_stamp.wav")
-            mixer.Sound.play(stamp_sound)
-            chosen_cell.value = GameHandler.enemy_symbol
-            DataTracker.enemy_move_list.append(chosen_cell.cid)
-            print(f"The enemy has successfully selected cell {chosen_cell.cid}!")
-            GameHandler.player_turn = True
-            GameHandler.time_taken = False
-
-        def move_decision(list_of_cell_lists: list[list[GridCell]]):
-            labels: list[str] = ["Winning", "Defensive", "Optimal", "Constructive"]
-            for index, option_list in enumerate(list_of_cell_lists):
-                if len(option_list) >= 1:
-                    cell_chosen = random.choice(option_list)
-                    resolve_enemy_turn(cell_chosen)
-                    print(f"{labels[index]} list was used")
-                    return True
-            return False
-
-        move_made: bool = move_decision([winning_moves, defensive_moves, optimal_moves, constructive_moves])
-
-        if move_made:
-            return
-
-        # Final method: Random selection
-        if not move_made:
-            row_choice = random.choice(grid_manager.grid)
-            cell_choice = random.choice(row_choice)
-
-            print(cell_choice.cid)
-
-            if not cell_choice.value:
-                resolve_enemy_turn(cell_choice)
-                return
-            else:
-                enemy_turn()  # Recurse
 
+def enemy_turn():
 
-def tie_check():
-    open_cells: int = 0
-    for row in grid_manager.grid:
-        for cell in row:
-            if not cell.value:
-                open_cells += 1
-    if open_cells == 0 and GameHandler.game_status == "ongoing":
-        print("There are no more available squares and no one has won. The game ends in a tie!")
-        GameHandler.game_status = "tied"
+    if GameHandler.game_status != "ongoing" or GameHandler.enemy_move_future is None:
         return
 
+    if not GameHandler.enemy_move_future.done():  # A search that ran past its budget gets a little longer
+        timers.schedule("enemy_turn", ENEMY_TURN_RETRY, enemy_turn)
+        return
 
-def win_loss_check(symbol):
-
-    # Checking rows (horizontal)
-    for row in grid_manager.grid:
-        symbol_count = 0
-        for cell in row:
-            if cell.value == symbol:
-                symbol_count += 1
-            else:  # Reset the count
-                symbol_count = 0
-            if symbol_count == GameHandler.current_mode.objective:
-                print("Victory condition reached (row)")
-                if symbol == GameHandler.player_symbol:
-                    GameHandler.game_status = "won"
-                    return
-                if symbol == GameHandler.enemy_symbol:
-                    GameHandler.game_status = "lost"
-                    return
-
-    # Checking columns
-    column_count = 0
-    while column_count <= GameHandler.current_mode.board.shape[1] - 1:
-        symbol_count = 0
-        for row in grid_manager.grid:
-            if row[column_count].value == symbol:
-                symbol_count += 1
-            else:
-                symbol_count = 0
-            if symbol_count == GameHandler.current_mode.objective:
-                print("Victory condition reached (column)")
-                if symbol == GameHandler.player_symbol:
-                    GameHandler.game_status = "won"
-                    return
-                if symbol == GameHandler.enemy_symbol:
-                    GameHandler.game_status = "lost"
-                    return
-
-        column_count += 1
-
-    # Checking forward-diagonals
-    for row_ind, row in enumerate(grid_manager.grid):
-        for col_ind, cell in enumerate(row):
-            y = row_ind
-            x = col_ind
-
-            symbol_count = 0
-
-            board_size_y = GameHandler.current_mode.board.shape[0]
-            board_size_x = GameHandler.current_mode.board.shape[1]
-
-            while True:
-                if y > board_size_y - 1 or x > board_size_x - 1:  # If values were larger than grid can support
-                    break
-
-                else:
-                    if grid_manager.grid[y][x].value == symbol:
-                        y += 1
-                        x += 1
-                        symbol_count += 1
-                        if symbol_count == GameHandler.current_mode.objective:
-                            print("Victory condition reached (forward diagonal)")
-                            if symbol == GameHandler.player_symbol:
-                                GameHandler.game_status = "won"
-                                return
-                            if symbol == GameHandler.enemy_symbol:
-                                GameHandler.game_status = "lost"
-                                return
-                    else:
-                        break
-
-    # Checking backwards diagonals
-    for row_ind, row in enumerate(grid_manager.grid):
-        for col_ind, cell in enumerate(row):
-            y = row_ind
-            x = col_ind
+    try:
+        chosen_cid = GameHandler.enemy_move_future.result()
+    except Exception as error:  # Including a worker process that died, which leaves the CPU worker unusable
+        print(f"The CPU worker failed ({error!r}), falling back to the move tiers")
+        cpu_worker.reset()
+        chosen_cid = board_logic.heuristic_move(grid_manager.board_state, board_logic.ENEMY, GameHandler.difficulty,
+                                                random)[0]
+    GameHandler.enemy_move_future = None
+    resolve_enemy_turn(chosen_cid)
 
-            symbol_count = 0
 
-            board_size_y = GameHandler.current_mode.board.shape[0]
+def win_loss_check(symbol, last_move: tuple[int, int]):
 
-            while True:
+    side = board_logic.PLAYER if symbol == GameHandler.player_symbol else board_logic.ENEMY
 
-                if y > board_size_y - 1 or x < 0:
-                    break
+    outcome, victory_cells = move_outcome(grid_manager.board_state, last_move, side)
+    if victory_cells:
+        print(f"Victory condition reached {victory_cells}")
+        grid_manager.victory_cells.update(victory_cells)
+    elif outcome == "tied":
+        print("There are no more available squares and no one has won. The game ends in a tie!")
 
-                else:
-                    if grid_manager.grid[y][x].value == symbol:
-                        y += 1
-                        x -= 1
-                        symbol_count += 1
-                        if symbol_count == GameHandler.current_mode.objective:
-                            print("Victory condition reached (backward diagonal)")
-                            if symbol == GameHandler.player_symbol:
-                                GameHandler.game_status = "won"
-                                return
-                            if symbol == GameHandler.enemy_symbol:
-                                GameHandler.game_status = "lost"
-                                return
+    if outcome and GameHandler.game_status == "ongoing":
+        GameHandler.game_status = outcome
 
-                    else:
-                        break
 
-    tie_check()
+def quit_game():
+    pygame.quit()  # The window closes straight away, even while the worker is still stopping
+    cpu_worker.shutdown()  # Stops a CPU move still being searched, so no search process is left behind
+    sys.exit()
 
 
 def post_game_reset():
@@ -1823,6 +1442,8 @@ def post_game_reset():
     elif GameHandler.game_status == "tied":
         DataTracker.ties.value += 1
 
+    timers.cancel("enemy_turn")
+    timers.cancel("post_game")
     grid_manager.grid = []
     DataTracker.player_move_list = []
     DataTracker.enemy_move_list = []
@@ -1834,17 +1455,44 @@ def post_game_reset():
 
 def main():
 
-    while True:
+    scenes.push(title_screen())
+    scenes.apply_transitions()
+    idle = False
+    first_frame = True
 
-        title_screen()
+    # The one frame loop of the game. The screen on top of the stack draws a frame and yields its frame rate. An idle
+    # screen whose last frame changed nothing and saw no input is left alone until the next event comes in
+    while True:
+        if idle:
+            frame_events.wait(IDLE_TIMEOUT)
+        else:
+            frame_events.pump()
 
-        for evnt in pygame.event.get():
+        for evnt in frame_events.events:
             if evnt.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        pygame.display.update()
-        clock.tick(15)
+                quit_game()
+            if evnt.type == pygame.WINDOWEXPOSED:
+                renderer.full_redraw = True
+            if evnt.type == pygame.VIDEORESIZE:
+                game_screen.set_resolution(evnt.w, evnt.h, pygame.RESIZABLE)
+
+        timers.dispatch(frame_events.events)
+
+        frame_rate = next(scenes.current())
+
+        renderer.end_frame()
+        if first_frame:
+            print(f"First frame shown {(time.perf_counter() - startup_start) * 1000:.0f} ms after startup "
+                  f"({font_registry.report()})")
+            first_frame = False
+        # A widget consumes the click it acts on, and what the click changed is often only drawn on the next frame,
+        # so any input at all keeps the loop going for at least one more frame
+        idle_rate = isinstance(frame_rate, IdleRate)
+        idle = idle_rate and not renderer.changed and not frame_events.received and not scenes.transitions
+        if not idle:
+            clock.tick(frame_rate.frame_rate if idle_rate else frame_rate)
+
+        scenes.apply_transitions()
 
 
 if __name__ == "__main__":
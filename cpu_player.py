@@ -0,0 +1,77 @@
+import random
+import threading
+from concurrent.futures import Future, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import board_logic
+import search_engine
+import mcts_engine
+
+
+def choose_move(board_state: board_logic.BoardState, side: int, cpu_engine: str, difficulty: int,
+                time_budget: float, verbose: bool = True) -> tuple[int, int]:
+    # Picks the CPU's next cell without touching the display, so it can run on the worker or in headless play
+    if cpu_engine == "negamax":
+        engine = search_engine.get_engine(board_state.geometry)
+        if search_engine.open_cell_count(board_state) >= search_engine.PARALLEL_MIN_CELLS:
+            move = engine.parallel_best_move(board_state, side, time_budget)
+        else:
+            move = engine.best_move(board_state, side, time_budget=time_budget)
+        if verbose:
+            print(f"Search engine reached depth {engine.completed_depth} after visiting {engine.nodes} positions "
+                  f"({engine.nodes_per_second:.0f} per second)")
+        return move
+
+    if cpu_engine == "mcts":
+        engine = mcts_engine.get_engine(board_state.geometry)
+        move = engine.best_move(board_state, side, time_budget=time_budget)
+        if verbose:
+            print(f"Monte Carlo search ran {engine.playouts} playouts")
+        return move
+
+    move, tier_label = board_logic.heuristic_move(board_state, side, difficulty, random)
+    if verbose:
+        print(f"{tier_label} list was used")
+    return move
+
+
+class CpuWorker:
+
+    # Runs choose_move away from the frame loop. A separate process keeps the search from holding the GIL while the
+    # game draws frames, but it is only used where the process can be forked (see search_engine.fork_context).
+    # Everywhere else a thread does the work. Setting the worker's cancel event makes a search in progress stop as if
+    # its time had run out
+
+    def __init__(self):
+        self.executor: Executor | None = None
+        self.cancel_event = None
+
+    def submit(self, board_state: board_logic.BoardState, side: int, cpu_engine: str, difficulty: int,
+               time_budget: float, verbose: bool = True) -> Future:
+        if self.executor is None:
+            if search_engine.fork_context() is not None:
+                self.cancel_event = search_engine.fork_context().Event()
+                self.executor = ProcessPoolExecutor(max_workers=1, mp_context=search_engine.fork_context(),
+                                                    initializer=search_engine.set_cancel_event,
+                                                    initargs=(self.cancel_event,))
+            else:
+                self.cancel_event = threading.Event()
+                search_engine.set_cancel_event(self.cancel_event)
+                self.executor = ThreadPoolExecutor(max_workers=1)
+        if isinstance(self.executor, ThreadPoolExecutor):
+            board_state = board_state.copy()  # A process gets its own copy when the position is pickled over to it
+        return self.executor.submit(choose_move, board_state, side, cpu_engine, difficulty, time_budget, verbose)
+
+    def reset(self):
+        # Drops a worker that failed without waiting on it. The next submit starts a new one
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def shutdown(self):
+        # Stops a search still in progress, then waits for the worker to exit along with any search processes it
+        # started
+        if self.executor is not None:
+            self.cancel_event.set()
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+            if search_engine.cancel_event is self.cancel_event:
+                search_engine.set_cancel_event(None)
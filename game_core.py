@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+import numpy as np
+import board_logic
+
+# The rules and data of Connect X, kept free of pygame so that they can be imported without opening a window or
+# starting the mixer. connectX.py draws all of this on screen, self_play.py and benchmarks.py run it headless
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Defining the GameMode class and creating several instances representing a variety of playable game modes
+
+
+@dataclass()
+class GameMode:
+    title: str  # The name of the game mode
+    board: np.ndarray  # The arrangement/dimensions of the game board_shape
+    objective: int  # The number of consecutive characters needed to win
+    cell_width: float = float(1 / 10)  # A cell's width as a share of the screen width
+    cell_height: float = float(1 / 7)  # A cell's height as a share of the screen height
+    cell_x_offset: float = float(0.15)  # A multiplier for determining a cell's generated position
+    cell_y_offset: float = float(0.12)  # A multiplier for determining a cell's generated position
+    x_offset_step: float = float(0.1)  # The space multiplier that separates each cell as they're generated
+    y_offset_step: float = float(0.15)
+    font: str = "large"  # The size of font that cell symbols are drawn in
+
+    @property
+    def geometry(self) -> board_logic.BoardGeometry:
+        return board_logic.get_geometry(self.board.shape[0], self.board.shape[1], self.objective)
+
+
+connect4 = GameMode("Connect4", np.full((6, 7), "-"), 4, cell_width=float(1 / 11),
+                    cell_height=float(1 / 8), x_offset_step=float(0.095),
+                    y_offset_step=float(0.125), cell_x_offset=float(0.17))
+
+connect3 = GameMode("Connect3", np.full((4, 5), "-"), 3, cell_width=float(1 / 8.5),
+                    cell_height=float(1 / 6.5), x_offset_step=float(0.12),
+                    y_offset_step=float(0.16), cell_x_offset=float(0.2))
+
+wide_boi = GameMode("Wide Boi", np.full((4, 8), "-"), 4, cell_x_offset=0.1, cell_y_offset=0.17, y_offset_step=0.15)
+
+tall_boi = GameMode("Tall Boi", np.full((8, 4), "-"), 4, cell_x_offset=0.33, cell_width=float(1 / 13),
+                    cell_height=float(1 / 10), x_offset_step=float(0.08), y_offset_step=float(0.1))
+
+tic_tac_toe = GameMode("Tic-Tac-Toe", np.full((3, 3), "-"), 3, cell_width=float(1 / 6.5),
+                       cell_height=float(1 / 5), x_offset_step=float(0.16),
+                       y_offset_step=float(0.22), cell_x_offset=float(0.24),
+                       font="xl")
+
+cheese_crackers = GameMode("Cheese & Crackers", np.full((5, 5), "-"), 4, cell_x_offset=0.24)
+
+deluxe = GameMode("Connect6", np.full((9, 10), "-"), 6, cell_x_offset=0.12, cell_width=float(1 / 15),
+                  cell_height=float(1 / 11), x_offset_step=0.07, y_offset_step=0.09)
+
+game_mode_list = [connect4, connect3, wide_boi, tall_boi, tic_tac_toe, cheese_crackers, deluxe]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Defining the Stat class and the Replay class to track in-game history
+
+
+@dataclass()
+class Stat:
+    name: str  # The name of the stat in question
+    value: int  # the value of that statistic
+
+
+@dataclass()
+class Replay:
+    id: int  # Unchanging unique identifier for each replay instance
+    name: str  # Name of the replay, can be edited by the user
+    game_mode: GameMode  # In which game mode did the game take place
+    player_moves: list  # The sequence of moves that the player made
+    enemy_moves: list  # The sequence of moves that the enemy made
+    priority: bool  # Whether player had the priority in the game or not
+    player_symbol: str
+    enemy_symbol: str
+
+    def __str__(self):
+        return f"Replay: {self.name}, Mode: {self.game_mode.title}, Turns: " \
+               f"{len(self.player_moves) if len(self.player_moves) >= len(self.enemy_moves) else len(self.enemy_moves)}"
+
+
+class ReplayManager:
+    r1 = Replay(1, "Empty", tic_tac_toe, [], [], True, "X", "O")
+    r2 = Replay(2, "Empty", tic_tac_toe, [], [], True, "X", "O")
+    r3 = Replay(3, "Empty", tic_tac_toe, [], [], True, "X", "O")
+    r4 = Replay(4, "Empty", tic_tac_toe, [], [], True, "X", "O")
+    r5 = Replay(5, "Empty", tic_tac_toe, [], [], True, "X", "O")
+
+    replay_list = [r1, r2, r3, r4, r5]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# The state of the game in progress
+
+
+class GameHandler:
+
+    current_mode = connect4
+
+    difficulty: int = 0  # Setting a CPU difficulty level variable
+    cpu_engine: str = "heuristic"  # Options are heuristic (the move tiers), negamax (Expert) and mcts (Gambler)
+
+    player_symbol: str = "X"
+    enemy_symbol: str = "O"
+
+    priority: bool = True  # Who goes/went first in a given game
+    player_turn = True
+
+    enemy_turn_length = 3500  # in milliseconds
+    enemy_move_future = None  # The CPU worker's pending move, kept here so it survives a trip to the sound menu
+
+    game_status: str = "pregame"  # Options are pregame, ongoing, won, lost, tied
+
+
+def move_outcome(board_state: board_logic.BoardState, last_move: tuple[int, int], side: int) \
+        -> tuple[str | None, list[tuple[int, int]]]:
+    # The game status a move leads to (won, lost or tied, from the player's point of view, or None if the game goes
+    # on) and the cells of any line it completed. Only the lines through the claimed cell can have become a win
+    victory_cells = board_state.winning_cells(last_move, side)
+    if victory_cells:
+        return "won" if side == board_logic.PLAYER else "lost", victory_cells
+    if board_state.is_full():
+        return "tied", []
+    return None, []
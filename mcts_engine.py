@@ -0,0 +1,139 @@
+import math
+import time
+from functools import lru_cache
+import numpy as np
+import board_logic
+import search_engine
+
+PLAYOUT_BATCH = 64  # Random playouts run together, as rows of one NumPy array, every time a leaf is expanded
+EXPLORATION = 1.4  # The UCT exploration constant
+NOT_COMPLETED = np.iinfo(np.int16).max  # Stands in for "never" when looking for the first completed line
+ENGINE_SEED: int | None = None  # Seeds the engines get_engine makes. None draws fresh entropy for each
+
+
+class MctsNode:
+
+    def __init__(self, parent, move: tuple[int, int] | None, side: int, untried_moves: list):
+        self.parent = parent
+        self.move = move
+        self.side = side  # The side that made the move leading to this node, whose point of view wins are counted in
+        self.untried_moves = untried_moves
+        self.children: list[MctsNode] = []
+        self.visits = 0
+        self.wins = 0.0
+        self.winner: int | None = None  # Set when the move leading here ends the game, EMPTY standing for a tie
+
+    def select_child(self) -> "MctsNode":
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits +
+                   EXPLORATION * math.sqrt(log_visits / child.visits))
+
+
+class MctsEngine:
+
+    # Monte Carlo Tree Search. The tree itself is walked one node at a time, but every expansion is scored with a
+    # whole batch of random playouts that are played out together as NumPy arrays
+
+    def __init__(self, geometry: board_logic.BoardGeometry, seed: int | None = None):
+        self.geometry = geometry
+        self.rng = np.random.default_rng(seed)
+        self.playouts = 0
+
+    def batched_playouts(self, cells: np.ndarray, side_to_move: int, count: int) -> np.ndarray:
+        # Plays (count) random games to the end from a flat board, returning the winner of each (EMPTY for a tie).
+        # Every playout is a random order of the open cells, with the sides taking turns along it. A side's first
+        # completed window is the latest move inside it, and whoever completes a window first wins that playout
+        open_positions = np.flatnonzero(cells == board_logic.EMPTY)
+        playout_rows = np.arange(count)[:, None]
+        fill_order = open_positions[self.rng.random((count, len(open_positions))).argsort(axis=1)]
+        turn_numbers = np.arange(len(open_positions), dtype=np.int16)
+
+        move_times = np.full((count, len(cells)), -1, dtype=np.int16)
+        move_times[playout_rows, fill_order] = turn_numbers
+        owners = np.repeat(cells[None, :], count, axis=0)
+        owners[playout_rows, fill_order] = np.where(turn_numbers % 2 == 0, side_to_move,
+                                                    board_logic.other_side(side_to_move))
+
+        window_owners = owners[:, self.geometry.window_cells]
+        window_times = move_times[:, self.geometry.window_cells].max(axis=2)
+        first_lines = {}
+        for side in (board_logic.PLAYER, board_logic.ENEMY):
+            completed = (window_owners == side).all(axis=2)
+            first_lines[side] = np.where(completed, window_times, NOT_COMPLETED).min(axis=1)
+
+        return np.where(first_lines[board_logic.PLAYER] < first_lines[board_logic.ENEMY], board_logic.PLAYER,
+                        np.where(first_lines[board_logic.ENEMY] < first_lines[board_logic.PLAYER], board_logic.ENEMY,
+                                 board_logic.EMPTY))
+
+    def best_move(self, board_state: board_logic.BoardState, side: int, time_budget: float | None = None,
+                  playouts: int | None = None) -> tuple[int, int]:
+        # Searches until the time budget (in seconds) or the playout budget runs out, whichever comes first, and
+        # plays the most visited move
+        tier_cells = board_state.move_tiers(side)
+        if tier_cells[board_logic.WINNING]:
+            return tier_cells[board_logic.WINNING][0]
+        root_moves = list(dict.fromkeys(tier_cells[board_logic.DEFENSIVE]))  # Blocks, if any are needed
+        if not root_moves:
+            root_moves = [(int(row), int(col)) for row, col in zip(*np.nonzero(board_state.cells == board_logic.EMPTY))]
+        if len(root_moves) == 1:
+            return root_moves[0]
+
+        if time_budget is None and playouts is None:
+            playouts = PLAYOUT_BATCH * 100
+        deadline = time.monotonic() + time_budget if time_budget is not None else math.inf
+
+        root = MctsNode(None, None, board_logic.other_side(side), root_moves)
+        self.playouts = 0
+        while time.monotonic() < deadline and (playouts is None or self.playouts < playouts) and \
+                not search_engine.search_cancelled():
+            node = root
+            bits = dict(board_state.bits)
+            cells = board_state.cells.ravel().copy()
+
+            # Selection: follow the best UCT scores down to a node that still has moves to try, or that ends the game
+            while not node.untried_moves and node.children and node.winner is None:
+                node = node.select_child()
+                bits[node.side] |= self.geometry.cell_bit(node.move)
+                cells[node.move[0] * self.geometry.cols + node.move[1]] = node.side
+
+            # Expansion: try one new move
+            if node.untried_moves and node.winner is None:
+                move = node.untried_moves.pop(self.rng.integers(len(node.untried_moves)))
+                mover = board_logic.other_side(node.side)
+                bits[mover] |= self.geometry.cell_bit(move)
+                cells[move[0] * self.geometry.cols + move[1]] = mover
+                open_moves = [(int(position) // self.geometry.cols, int(position) % self.geometry.cols)
+                              for position in np.flatnonzero(cells == board_logic.EMPTY)]
+                child = MctsNode(node, move, mover, open_moves)
+                if self.geometry.completes_line(bits[mover], move):
+                    child.winner = mover
+                    child.untried_moves = []
+                elif not open_moves:
+                    child.winner = board_logic.EMPTY
+                node.children.append(child)
+                node = child
+
+            # Simulation: a finished game counts once, anything else is scored with a batch of playouts
+            if node.winner is not None:
+                winners = np.array([node.winner])
+            else:
+                winners = self.batched_playouts(cells, board_logic.other_side(node.side), PLAYOUT_BATCH)
+            self.playouts += len(winners)
+            ties = int(np.count_nonzero(winners == board_logic.EMPTY))
+            side_wins = {player_side: int(np.count_nonzero(winners == player_side))
+                         for player_side in (board_logic.PLAYER, board_logic.ENEMY)}
+
+            # Backpropagation
+            while node is not None:
+                node.visits += len(winners)
+                node.wins += side_wins[node.side] + ties / 2
+                node = node.parent
+
+        if not root.children:
+            return root_moves[0]
+        return max(root.children, key=lambda child: child.visits).move
+
+
+@lru_cache(maxsize=None)
+def get_engine(geometry: board_logic.BoardGeometry) -> MctsEngine:
+    return MctsEngine(geometry, ENGINE_SEED)
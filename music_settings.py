@@ -43,3 +43,27 @@ class MusicSettings:
         mixer.music.set_volume(self.volume_level / 300)
         mixer.music.play(-1)
 
+
+class SoundBank:
+
+    # Every sound effect is decoded once and the same Sound object is played again after that, so clicks and hovers
+    # don't open and decode a file each time
+    effects = {"click": "audio/click_v2.mp3", "button_click": "audio/button_click.mp3",
+               "rejection": "audio/rejection.wav", "stamp": "audio/kermite607_stamp.wav",
+               "coin_flip": "audio/coin-flip.wav", "win": "audio/win.wav", "lose": "audio/lose.wav",
+               "tie": "audio/tie.mp3"}
+
+    def __init__(self):
+        self.sounds: dict[str, mixer.Sound] = {}
+
+    def preload(self):
+        for name in self.effects:
+            self.get(name)
+
+    def get(self, name: str) -> mixer.Sound:
+        if name not in self.sounds:
+            self.sounds[name] = mixer.Sound(self.effects[name])
+        return self.sounds[name]
+
+    def play(self, name: str):
+        self.get(name).play()
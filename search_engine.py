@@ -0,0 +1,384 @@
+import os
+import sys
+import math
+import random
+import time
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import board_logic
+
+WIN_SCORE = 1_000_000  # Any score above WIN_SCORE - (number of cells) is a forced win
+LINE_WEIGHTS_BASE = 4  # A window holding n stones of one side only is worth LINE_WEIGHTS_BASE ** n
+NODE_BUDGET = 2_000  # Used to pick a search depth that keeps a turn short on every board size
+TABLE_LIMIT = 1_000_000  # The transposition table is cleared once it grows past this many entries
+
+TIME_CHECK_INTERVAL = 256  # How many positions are visited between checks of the search deadline
+PARALLEL_MIN_CELLS = 50  # Open cells from which root moves are split across processes. Connect4 (42) never is
+SEARCH_WORKERS = os.cpu_count() or 1  # Processes a parallel search is split across
+SHARED_ENTRY_DEPTH = 2  # Only table entries at least this deep are worth sending between processes
+
+cancel_event = None  # Given to the CPU worker, and set to stop its search early when the game quits
+
+# Transposition table flags, telling how a stored score relates to the true score of the position
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchTimeout(Exception):
+    pass  # Raised inside the search once the deadline has passed, to unwind an unfinished iteration
+
+
+class SearchEngine:
+
+    # Negamax search with alpha-beta pruning over the two sides' bitboards. Positions are keyed by a Zobrist hash
+    # in a transposition table, which is kept between turns
+
+    def __init__(self, geometry: board_logic.BoardGeometry, seed: int = 0):
+        self.geometry = geometry
+        self.cells = [(row, col) for row in range(geometry.rows) for col in range(geometry.cols)]
+        self.cell_bits = {cid: geometry.cell_bit(cid) for cid in self.cells}
+
+        # Centre cells take part in the most windows, so they are tried first
+        centre_row, centre_col = (geometry.rows - 1) / 2, (geometry.cols - 1) / 2
+        self.centre_order = sorted(self.cells, key=lambda cid: (abs(cid[0] - centre_row) + abs(cid[1] - centre_col),
+                                                                -len(geometry.cell_windows[cid])))
+
+        rng = random.Random(seed)
+        self.zobrist_keys = {side: {cid: rng.getrandbits(64) for cid in self.cells}
+                             for side in (board_logic.PLAYER, board_logic.ENEMY)}
+        self.side_to_move_key = rng.getrandbits(64)
+
+        self.transposition_table: dict[int, tuple[int, int, int, tuple[int, int] | None]] = {}
+        self.nodes = 0
+        self.deadline: float | None = None  # A time.monotonic() value, or None for searches of a fixed depth
+        self.completed_depth = 0  # The deepest iteration the last search finished
+        self.nodes_per_second = 0.0  # Measured over the last search, across every process that took part
+        self.new_entries: dict | None = None  # While a pool process searches, the deep entries it stored so far
+
+    def position_hash(self, board_state: board_logic.BoardState, side: int) -> int:
+        zobrist_hash = self.side_to_move_key if side == board_logic.ENEMY else 0
+        for stone_side in (board_logic.PLAYER, board_logic.ENEMY):
+            for cid in self.cells:
+                if board_state.bits[stone_side] & self.cell_bits[cid]:
+                    zobrist_hash ^= self.zobrist_keys[stone_side][cid]
+        return zobrist_hash
+
+    def evaluate(self, own_bits: int, other_bits: int) -> int:
+        score = 0
+        for mask in self.geometry.window_masks:
+            own_count = (own_bits & mask).bit_count()
+            other_count = (other_bits & mask).bit_count()
+            if own_count and not other_count:
+                score += LINE_WEIGHTS_BASE ** own_count
+            elif other_count and not own_count:
+                score -= LINE_WEIGHTS_BASE ** other_count
+        return score
+
+    def ordered_moves(self, own_bits: int, other_bits: int, table_move) -> tuple[list, bool]:
+        # Returns the moves to try, and whether the first one wins on the spot. Winning moves come first, then
+        # blocks of the opponent's winning moves, then the rest from the centre outwards
+        occupied = own_bits | other_bits
+        blocks = []
+        others = []
+        for cid in self.centre_order:
+            bit = self.cell_bits[cid]
+            if occupied & bit:
+                continue
+            if self.geometry.completes_line(own_bits | bit, cid):
+                return [cid], True
+            if self.geometry.completes_line(other_bits | bit, cid):
+                blocks.append(cid)
+            else:
+                others.append(cid)
+
+        if blocks:
+            return blocks, False  # Any other move loses straight away, so only blocks are worth searching
+
+        if table_move in others:
+            others.remove(table_move)
+            others.insert(0, table_move)
+        return others, False
+
+    def negamax(self, own_bits: int, other_bits: int, side: int, depth: int, alpha: int, beta: int, ply: int,
+                zobrist_hash: int) -> int:
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % TIME_CHECK_INTERVAL == 0 and \
+                (time.monotonic() >= self.deadline or search_cancelled()):
+            raise SearchTimeout
+        original_alpha = alpha
+
+        table_move = None
+        entry = self.transposition_table.get(zobrist_hash)
+        if entry:
+            entry_depth, entry_score, entry_flag, table_move = entry
+            if entry_depth >= depth:
+                entry_score = score_from_table(entry_score, ply)
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                elif entry_flag == UPPER_BOUND:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        moves, immediate_win = self.ordered_moves(own_bits, other_bits, table_move)
+        if immediate_win:
+            return WIN_SCORE - ply - 1
+        if not moves:
+            return 0  # The board is full
+        if depth == 0:
+            return self.evaluate(own_bits, other_bits)
+
+        other = board_logic.other_side(side)
+        best_score = -math.inf
+        best_move = moves[0]
+        for cid in moves:
+            score = -self.negamax(other_bits, own_bits | self.cell_bits[cid], other, depth - 1, -beta, -alpha,
+                                  ply + 1, zobrist_hash ^ self.zobrist_keys[side][cid] ^ self.side_to_move_key)
+            if score > best_score:
+                best_score = score
+                best_move = cid
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        if len(self.transposition_table) >= TABLE_LIMIT:
+            self.transposition_table.clear()
+        table_entry = (depth, score_to_table(best_score, ply), flag, best_move)
+        self.transposition_table[zobrist_hash] = table_entry
+        if self.new_entries is not None and depth >= SHARED_ENTRY_DEPTH:
+            self.new_entries[zobrist_hash] = table_entry
+        return best_score
+
+    def search_moves(self, own_bits: int, other_bits: int, side: int, moves: list, depth: int, zobrist_hash: int) \
+            -> tuple[tuple[int, int], int, dict]:
+        # Searches the given root moves, returning the best one, its score and the score found for every move
+        alpha, beta = -math.inf, math.inf
+        best_move, best_score = moves[0], -math.inf
+        move_scores = {}
+        for cid in moves:
+            score = -self.negamax(other_bits, own_bits | self.cell_bits[cid], board_logic.other_side(side),
+                                  depth - 1, -beta, -alpha, 1,
+                                  zobrist_hash ^ self.zobrist_keys[side][cid] ^ self.side_to_move_key)
+            move_scores[cid] = score
+            if score > best_score:
+                best_move, best_score = cid, score
+            alpha = max(alpha, score)
+        return best_move, best_score, move_scores
+
+    def search_root(self, board_state: board_logic.BoardState, side: int, depth: int) \
+            -> tuple[tuple[int, int], int]:
+        own_bits = board_state.bits[side]
+        other_bits = board_state.bits[board_logic.other_side(side)]
+        zobrist_hash = self.position_hash(board_state, side)
+
+        entry = self.transposition_table.get(zobrist_hash)
+        moves, immediate_win = self.ordered_moves(own_bits, other_bits, entry[3] if entry else None)
+        if immediate_win or len(moves) == 1:
+            return moves[0], WIN_SCORE if immediate_win else 0
+
+        best_move, best_score, _ = self.search_moves(own_bits, other_bits, side, moves, depth, zobrist_hash)
+        self.transposition_table[zobrist_hash] = (depth, best_score, EXACT, best_move)
+        return best_move, best_score
+
+    def best_move(self, board_state: board_logic.BoardState, side: int, depth: int | None = None,
+                  time_budget: float | None = None) -> tuple[int, int]:
+        # With a time budget (in seconds) the search deepens one ply at a time until the budget runs out, and plays
+        # the move of the deepest iteration it finished. Otherwise it searches once, to a fixed depth
+        self.nodes = 0
+        self.completed_depth = 0
+        start_time = time.monotonic()
+        if time_budget is None:
+            self.deadline = None
+            if depth is None:
+                depth = default_depth(board_state)
+            move = self.search_root(board_state, side, depth)[0]
+            self.completed_depth = depth
+            self.nodes_per_second = self.nodes / max(time.monotonic() - start_time, 1e-9)
+            return move
+
+        self.deadline = start_time + time_budget
+        max_depth = depth if depth is not None else open_cell_count(board_state)
+        move = None
+        try:
+            for iteration_depth in range(1, max_depth + 1):
+                move, score = self.search_root(board_state, side, iteration_depth)
+                self.completed_depth = iteration_depth
+                if abs(score) > WIN_SCORE // 2:
+                    break  # A forced result was found, searching deeper can't change the move
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        if move is None:  # Not even the first iteration finished in time
+            move = self.search_root(board_state, side, 1)[0]
+        self.nodes_per_second = self.nodes / max(time.monotonic() - start_time, 1e-9)
+        return move
+
+    def parallel_best_move(self, board_state: board_logic.BoardState, side: int, time_budget: float,
+                           workers: int | None = None) -> tuple[int, int]:
+        # Iterative deepening where every iteration deals the root moves out to a pool of processes. Each process keeps
+        # its own engine and table between iterations and turns. The deep entries each iteration stores are merged here
+        # and sent to every process for the next one. All engines share seed 0, so their Zobrist hashes agree
+        workers = workers or SEARCH_WORKERS
+        if workers <= 1 or fork_context() is None:
+            # Shallow-search fallback: a single core can't keep up with a full-depth search on a large board
+            return self.best_move(board_state, side, depth=default_depth(board_state), time_budget=time_budget)
+
+        start_time = time.monotonic()
+        deadline = start_time + time_budget
+        own_bits = board_state.bits[side]
+        other_bits = board_state.bits[board_logic.other_side(side)]
+        zobrist_hash = self.position_hash(board_state, side)
+
+        self.nodes = 0
+        self.completed_depth = 0
+        self.nodes_per_second = 0.0  # Stays at 0 if the move is forced and no search is needed
+        entry = self.transposition_table.get(zobrist_hash)
+        moves, immediate_win = self.ordered_moves(own_bits, other_bits, entry[3] if entry else None)
+        best_move = moves[0]
+        if immediate_win or len(moves) == 1:
+            return best_move
+
+        pool = get_search_pool(workers)
+        shared_entries: dict = {}
+        for depth in range(1, open_cell_count(board_state) + 1):
+            chunks = [moves[index::workers] for index in range(workers) if moves[index::workers]]
+            futures = [pool.submit(search_root_moves, self.geometry, own_bits, other_bits, side, chunk, depth,
+                                   zobrist_hash, deadline, shared_entries) for chunk in chunks]
+            results = [future.result() for future in futures]
+            self.nodes += sum(result[3] for result in results)
+            if not all(result[4] for result in results):
+                break  # The deadline passed mid-iteration, so the previous iteration's move stands
+
+            move_scores: dict = {}
+            shared_entries = {}
+            for result in results:
+                move_scores.update(result[2])
+                for key, table_entry in result[5].items():
+                    if key not in shared_entries or shared_entries[key][0] < table_entry[0]:
+                        shared_entries[key] = table_entry
+            if len(self.transposition_table) + len(shared_entries) >= TABLE_LIMIT:
+                self.transposition_table.clear()
+            self.transposition_table.update(shared_entries)
+
+            moves = sorted(moves, key=lambda cid: move_scores[cid], reverse=True)  # Best moves lead the next deal
+            best_move = moves[0]
+            self.completed_depth = depth
+            if abs(move_scores[best_move]) > WIN_SCORE // 2:
+                break
+
+        self.nodes_per_second = self.nodes / max(time.monotonic() - start_time, 1e-9)
+        return best_move
+
+
+def search_root_moves(geometry: board_logic.BoardGeometry, own_bits: int, other_bits: int, side: int, moves: list,
+                      depth: int, zobrist_hash: int, deadline: float, shared_entries: dict) -> tuple:
+    # Runs inside a search pool process. Returns the best move, its score, every move's score, the positions visited,
+    # whether the search finished before the deadline, and the deep table entries this search stored, to share with
+    # the other processes. Entries from earlier searches were shared when they were made
+    engine = get_engine(geometry)
+    for key, table_entry in shared_entries.items():
+        if key not in engine.transposition_table or engine.transposition_table[key][0] < table_entry[0]:
+            engine.transposition_table[key] = table_entry
+
+    engine.nodes = 0
+    engine.deadline = deadline
+    engine.new_entries = {}
+    try:
+        best_move, best_score, move_scores = engine.search_moves(own_bits, other_bits, side, moves, depth,
+                                                                 zobrist_hash)
+    except SearchTimeout:
+        return None, 0, {}, engine.nodes, False, {}
+    finally:
+        engine.deadline = None
+        new_entries, engine.new_entries = engine.new_entries, None
+
+    return best_move, best_score, move_scores, engine.nodes, True, new_entries
+
+
+def search_cancelled() -> bool:
+    # Checked alongside the deadline. Search pool processes are forked from the CPU worker, so they share its event
+    return cancel_event is not None and cancel_event.is_set()
+
+
+def set_cancel_event(event):
+    global cancel_event
+    cancel_event = event
+
+
+def fork_context():
+    # Worker processes are forked, because a spawned one would import (and so re-run) the game's main script. macOS
+    # offers fork but doesn't support it once the display is up, so it is left out along with Windows
+    if "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin":
+        return multiprocessing.get_context("fork")
+    return None
+
+
+search_pools: dict[tuple[int, int], ProcessPoolExecutor] = {}  # Keyed by the owning process id and the worker count
+
+
+def get_search_pool(workers: int) -> ProcessPoolExecutor:
+    key = (os.getpid(), workers)
+    if key not in search_pools:
+        if not any(pid == os.getpid() for pid, _ in search_pools):
+            # A process that exits first waits on its child processes, forever if they are pool processes that were
+            # never told to stop. The CPU worker's process, where the pools are usually made, gets no interpreter exit
+            # hooks to stop them, so this runs then instead. It has to run ahead of the finalizers of the pools' own
+            # queues (priority 10), which would otherwise close them before the stop messages go out
+            multiprocessing.util.Finalize(None, shutdown_search_pools, exitpriority=20)
+        search_pools[key] = ProcessPoolExecutor(max_workers=workers, mp_context=fork_context())
+    return search_pools[key]
+
+
+def shutdown_search_pools():
+    for (pid, _), pool in search_pools.items():
+        if pid == os.getpid():
+            pool.shutdown(cancel_futures=True)
+
+
+def open_cell_count(board_state: board_logic.BoardState) -> int:
+    return len(board_state.geometry.cell_windows) - (board_state.bits[board_logic.PLAYER] |
+                                                     board_state.bits[board_logic.ENEMY]).bit_count()
+
+
+def default_depth(board_state: board_logic.BoardState) -> int:
+    # Deep enough to play small boards perfectly, shallow enough not to stall on the Connect6 board
+    open_cells = open_cell_count(board_state)
+    if open_cells <= 1:
+        return 1
+    # Alpha-beta with good move ordering visits roughly (open cells) ** (depth / 2) positions
+    return max(2, min(open_cells, int(2 * math.log(NODE_BUDGET) / math.log(open_cells))))
+
+
+def score_to_table(score: int, ply: int) -> int:
+    # Win scores are stored relative to the position they were found in, so they stay valid at any ply
+    if score > WIN_SCORE // 2:
+        return score + ply
+    if score < -WIN_SCORE // 2:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    if score > WIN_SCORE // 2:
+        return score - ply
+    if score < -WIN_SCORE // 2:
+        return score + ply
+    return score
+
+
+@lru_cache(maxsize=None)
+def get_engine(geometry: board_logic.BoardGeometry) -> SearchEngine:
+    return SearchEngine(geometry)
@@ -0,0 +1,107 @@
+import time
+import random
+import argparse
+from dataclasses import dataclass, field
+import board_logic
+import cpu_player
+import search_engine
+import mcts_engine
+import game_core
+
+GAME_MODES: dict[str, game_core.GameMode] = {mode.title: mode for mode in game_core.game_mode_list}
+
+
+@dataclass()
+class CpuSettings:
+    cpu_engine: str = "heuristic"  # heuristic, negamax or mcts, as in GameHandler.cpu_engine
+    difficulty: int = 0
+    time_budget: float = 0.05  # Seconds per move, for the negamax and mcts engines
+
+
+@dataclass()
+class SelfPlayReport:
+    mode_title: str
+    games: int = 0
+    outcomes: dict = field(default_factory=lambda: {"player": 0, "enemy": 0, "tied": 0})
+    moves: int = 0
+    move_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    def __str__(self):
+        return f"{self.mode_title:<18} games: {self.games:>6}  games/sec: {self.games / self.total_seconds:>9.1f}  " \
+               f"avg move: {self.move_seconds / max(self.moves, 1) * 1000:>8.3f} ms  " \
+               f"player/enemy/tied: {self.outcomes['player']}/{self.outcomes['enemy']}/{self.outcomes['tied']}"
+
+
+def play_game(geometry: board_logic.BoardGeometry, settings: dict[int, CpuSettings], first_side: int,
+              report: SelfPlayReport, worker: cpu_player.CpuWorker | None = None):
+    # One CPU-vs-CPU game, following the same rules as connect_game. With a worker, moves are chosen on it, as the
+    # game does it
+    board_state = board_logic.BoardState(geometry)
+    side = first_side
+    while True:
+        side_settings = settings[side]
+        move_start = time.perf_counter()
+        if worker:
+            move = worker.submit(board_state, side, side_settings.cpu_engine, side_settings.difficulty,
+                                 side_settings.time_budget, verbose=False).result()
+        else:
+            move = cpu_player.choose_move(board_state, side, side_settings.cpu_engine, side_settings.difficulty,
+                                          side_settings.time_budget, verbose=False)
+        report.move_seconds += time.perf_counter() - move_start
+        report.moves += 1
+
+        board_state.claim(move, side)
+        outcome, _ = game_core.move_outcome(board_state, move, side)
+        if outcome:
+            report.outcomes[{"won": "player", "lost": "enemy", "tied": "tied"}[outcome]] += 1
+            return
+        side = board_logic.other_side(side)
+
+
+def run_self_play(mode_title: str, games: int, settings: dict[int, CpuSettings],
+                  worker: cpu_player.CpuWorker | None = None) -> SelfPlayReport:
+    geometry = GAME_MODES[mode_title].geometry
+    report = SelfPlayReport(mode_title)
+    start = time.perf_counter()
+    for game_number in range(games):
+        # The first move alternates between the sides, like the coin toss would
+        play_game(geometry, settings, board_logic.PLAYER if game_number % 2 == 0 else board_logic.ENEMY, report,
+                  worker)
+        report.games += 1
+    report.total_seconds = time.perf_counter() - start
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless CPU-vs-CPU games, to measure the engines' throughput")
+    parser.add_argument("--games", type=int, default=1000, help="games to play per game mode")
+    parser.add_argument("--mode", choices=list(GAME_MODES), action="append", help="game mode (default: all)")
+    parser.add_argument("--player-engine", default="heuristic", choices=["heuristic", "negamax", "mcts"])
+    parser.add_argument("--enemy-engine", default="heuristic", choices=["heuristic", "negamax", "mcts"])
+    parser.add_argument("--difficulty", type=int, default=0, help="overlook chance for the heuristic engine")
+    parser.add_argument("--time-budget", type=float, default=0.05, help="seconds per move for the search engines")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seeds the heuristic and mcts engines. Searches bounded by --time-budget still depend on "
+                             "how far they get in time")
+    parser.add_argument("--cpu-worker", action="store_true",
+                        help="choose moves on the game's CPU worker, which also checks that the worker and any search "
+                             "processes it started let the program exit")
+    parser.add_argument("--search-workers", type=int, default=search_engine.SEARCH_WORKERS,
+                        help="processes a negamax search on a large board is split across")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    mcts_engine.ENGINE_SEED = args.seed
+    search_engine.SEARCH_WORKERS = args.search_workers
+    worker = cpu_player.CpuWorker() if args.cpu_worker else None
+    settings = {board_logic.PLAYER: CpuSettings(args.player_engine, args.difficulty, args.time_budget),
+                board_logic.ENEMY: CpuSettings(args.enemy_engine, args.difficulty, args.time_budget)}
+    for mode_title in args.mode or list(GAME_MODES):
+        print(run_self_play(mode_title, args.games, settings, worker))
+    if worker:
+        worker.shutdown()  # Hangs if a search process outlives the worker
+
+
+if __name__ == "__main__":
+    main()